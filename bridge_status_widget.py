@@ -4,7 +4,7 @@ BridgeStatusWidget - shows UDP bridge status and log, start/stop controls
 from typing import Dict, Any
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, QTextEdit, QCheckBox
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, QPlainTextEdit, QCheckBox
 )
 
 from simulate_tracking_widget import SimulateTrackingWidget
@@ -18,7 +18,7 @@ class BridgeStatusWidget(QWidget):
 
     def __init__(self):
         super().__init__()
-        self._last_log_len = 0
+        self._last_log_total = 0
         self.setup_ui()
 
     def setup_ui(self):
@@ -67,9 +67,11 @@ class BridgeStatusWidget(QWidget):
         layout.addLayout(ctrl)
 
         # Log
-        self.log_view = QTextEdit()
+        self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
         self.log_view.setPlaceholderText("Bridge log will appear here...")
+        # The view drops its oldest lines itself, so new lines can just be appended
+        self.log_view.setMaximumBlockCount(300)
         layout.addWidget(self.log_view)
 
         # Simulate tracking widget below the log
@@ -122,12 +124,20 @@ class BridgeStatusWidget(QWidget):
         self.last_label.setText(f"Last: {last_time} | {snap.get('last_status') or '-'}{extra_txt}")
 
         logs = snap.get("log") or []
-        if isinstance(logs, list):
-            if len(logs) != self._last_log_len:
-                view_lines = logs[-300:]
-                self.log_view.setPlainText("\n".join(view_lines))
-                self.log_view.verticalScrollBar().setValue(self.log_view.verticalScrollBar().maximum())
-                self._last_log_len = len(logs)
+        if not isinstance(logs, list):
+            logs = []
+        # Snapshots without a running count fall back to the list length
+        total = snap.get("log_total", len(logs))
+        if isinstance(total, int) and total != self._last_log_total:
+            new = total - self._last_log_total
+            if 0 < new <= len(logs):
+                # Only the lines that arrived since the last snapshot
+                self.log_view.appendPlainText("\n".join(logs[-new:]))
+            else:
+                # Bridge restarted, or more lines arrived than the snapshot keeps
+                self.log_view.setPlainText("\n".join(logs[-300:]))
+            self.log_view.verticalScrollBar().setValue(self.log_view.verticalScrollBar().maximum())
+            self._last_log_total = total
 
     def set_controls_state(self, running: bool):
         self.start_btn.setEnabled(not running)
@@ -1,14 +1,62 @@
 """
 CurrentFlightWidget - enter current flight information, SimBrief import controls
 """
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, Tuple
 
-from PySide6.QtCore import QSettings
-from PySide6.QtGui import QIntValidator
+from PySide6.QtCore import Qt, QSettings
+from PySide6.QtGui import QIntValidator, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QHBoxLayout, QLineEdit, QPushButton, QTextEdit, QComboBox, QLabel
 )
 
+# (code, combo text) pairs for the flight type selector, formatted once at import
+_FLIGHT_TYPES: Tuple[Tuple[str, str], ...] = tuple((code, f"{code} - {label}") for code, label in (
+    ("J", "Scheduled Pax"), ("F", "Scheduled Cargo"), ("C", "Charter Pax Only"),
+    ("A", "Additional Cargo"), ("E", "VIP"), ("G", "Additional Pax"),
+    ("H", "Charter Cargo/Mail"), ("I", "Ambulance"), ("K", "Training"),
+    ("M", "Mail Service"), ("O", "Charter Special"), ("P", "Positioning"),
+    ("T", "Technical Test"), ("W", "Military"), ("X", "Technical Stop"),
+    ("S", "Shuttle"), ("B", "Additional Shuttle"), ("Q", "Cargo In Cabin"),
+    ("R", "Addtl Cargo In Cabin"), ("L", "Charter Cargo In Cabin"),
+    ("D", "General Aviation"), ("N", "Air Taxi"), ("Y", "Company Specific"), ("Z", "Other")
+))
+
+# Letter, whitespace, digit: "B 738" -> "B738"
+_AC_NAME_SPACE_RE = re.compile(r'([A-Za-z])\s+(\d)')
+
+
+def _normalize_ac_name(s: Any) -> str:
+    """Close the gap between a type's letter and digits, keeping any ' | suffix'."""
+    try:
+        s = str(s)
+        if '|' in s:
+            left, sep, right = s.partition('|')
+            left = _AC_NAME_SPACE_RE.sub(r'\1\2', left.strip())
+            return f"{left} | {right.strip()}"
+        return _AC_NAME_SPACE_RE.sub(r'\1\2', s)
+    except Exception:
+        return str(s)
+
+
+def _fill_combo(combo: QComboBox, items: List[Tuple[str, Any]]) -> None:
+    """Replace the combo's entries with (text, userData) pairs.
+
+    The items are built in a detached QStandardItemModel and swapped in with one
+    setModel call; the combo owns the new model and deletes the old one.
+    """
+    model = QStandardItemModel(len(items), 1, combo)
+    for i, (text, data) in enumerate(items):
+        item = QStandardItem(text)
+        item.setData(data, Qt.UserRole)
+        model.setItem(i, 0, item)
+    combo.blockSignals(True)
+    try:
+        combo.setModel(model)
+        combo.setCurrentIndex(0 if items else -1)
+    finally:
+        combo.blockSignals(False)
+
 
 class CurrentFlightWidget(QWidget):
     """Widget for entering current flight information"""
@@ -75,18 +123,8 @@ class CurrentFlightWidget(QWidget):
         form.addRow("Code:", self.code_input)
 
         self.flight_type_combo = QComboBox()
-        flight_types = [
-            ("J", "Scheduled Pax"), ("F", "Scheduled Cargo"), ("C", "Charter Pax Only"),
-            ("A", "Additional Cargo"), ("E", "VIP"), ("G", "Additional Pax"),
-            ("H", "Charter Cargo/Mail"), ("I", "Ambulance"), ("K", "Training"),
-            ("M", "Mail Service"), ("O", "Charter Special"), ("P", "Positioning"),
-            ("T", "Technical Test"), ("W", "Military"), ("X", "Technical Stop"),
-            ("S", "Shuttle"), ("B", "Additional Shuttle"), ("Q", "Cargo In Cabin"),
-            ("R", "Addtl Cargo In Cabin"), ("L", "Charter Cargo In Cabin"),
-            ("D", "General Aviation"), ("N", "Air Taxi"), ("Y", "Company Specific"), ("Z", "Other")
-        ]
-        for code, label in flight_types:
-            self.flight_type_combo.addItem(f"{code} - {label}", userData=code)
+        for code, display in _FLIGHT_TYPES:
+            self.flight_type_combo.addItem(display, userData=code)
         form.addRow("Flight Type:", self.flight_type_combo)
 
         self.aircraft_combo = QComboBox()
@@ -183,36 +221,17 @@ class CurrentFlightWidget(QWidget):
         self.setLayout(outer)
 
     def set_airlines(self, airlines: List[Dict[str, Any]]):
-        self.airline_combo.clear()
-        for a in airlines:
-            name = a.get('name') or a.get('icao') or str(a.get('id'))
-            self.airline_combo.addItem(str(name), userData=a)
+        items = [(str(a.get('name') or a.get('icao') or str(a.get('id'))), a) for a in airlines]
+        _fill_combo(self.airline_combo, items)
 
     def set_fleet(self, fleet: List[Dict[str, Any]]):
-        import re
-        self.aircraft_combo.clear()
-
-        def _normalize_ac_name(s: Any) -> str:  # type: ignore[name-defined]
-            try:
-                s = str(s)
-                if '|' in s:
-                    left, sep, right = s.partition('|')
-                    left = left.strip()
-                    left = re.sub(r'([A-Za-z])\s+(\d)', r'\1\2', left)
-                    return f"{left} | {right.strip()}"
-                return re.sub(r'([A-Za-z])\s+(\d)', r'\1\2', s)
-            except Exception:
-                return str(s)
-
         names = []
         for ac in fleet:
             raw = ac.get('name') or ac.get('registration') or ac.get('id')
             disp = _normalize_ac_name(raw)
             names.append((disp, ac))
         names.sort(key=lambda x: x[0])
-        self.aircraft_combo.clear()
-        for disp, ac in names:
-            self.aircraft_combo.addItem(str(disp), userData=ac)
+        _fill_combo(self.aircraft_combo, names)
 
     def update_udp_snapshot(self, snap: Dict[str, Any]):
         try:
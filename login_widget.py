@@ -16,6 +16,7 @@ class LoginWidget(QWidget):
 
     def __init__(self):
         super().__init__()
+        self._settings = QSettings()
         self.setup_ui()
 
     def setup_ui(self):
@@ -37,8 +38,7 @@ class LoginWidget(QWidget):
         self.base_url_input = QLineEdit()
         self.base_url_input.setPlaceholderText("https://your-phpvms.com")
         # Load cached settings
-        settings = QSettings()
-        cached_base_url = settings.value("api/base_url", "")
+        cached_base_url = self._settings.value("api/base_url", "")
         if cached_base_url:
             self.base_url_input.setText(str(cached_base_url))
         form_layout.addRow("Base URL:", self.base_url_input)
@@ -46,7 +46,7 @@ class LoginWidget(QWidget):
         self.api_key_input = QLineEdit()
         self.api_key_input.setPlaceholderText("Your API key")
         self.api_key_input.setEchoMode(QLineEdit.Password)
-        cached_api_key = settings.value("api/api_key", "")
+        cached_api_key = self._settings.value("api/api_key", "")
         if cached_api_key:
             self.api_key_input.setText(str(cached_api_key))
         form_layout.addRow("API Key:", self.api_key_input)
@@ -85,9 +85,14 @@ class LoginWidget(QWidget):
         if not base_url.startswith(('http://', 'https://')):
             base_url = 'https://' + base_url
 
-        settings = QSettings()
-        settings.setValue("api/base_url", base_url)
-        settings.setValue("api/api_key", api_key)
+        # Only touch the settings file when the credentials actually changed
+        changed = False
+        for key, value in (("api/base_url", base_url), ("api/api_key", api_key)):
+            if self._settings.value(key, "") != value:
+                self._settings.setValue(key, value)
+                changed = True
+        if changed:
+            self._settings.sync()
 
         self.login_requested.emit(base_url, api_key)
 
@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, FrozenSet, Optional
 
 
 class PirepState(Enum):
@@ -42,8 +42,25 @@ class AircraftStatus(Enum):
     RETIRED = 3
 
 
-@dataclass
-class User:
+# Declared field names per model class, filled on first from_dict()
+_FIELD_NAMES: Dict[type, FrozenSet[str]] = {}
+
+
+class _FromDict:
+    """Adds from_dict() to the slotted data models below"""
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Build from an API payload dict, ignoring keys the model does not declare."""
+        names = _FIELD_NAMES.get(cls)
+        if names is None:
+            names = _FIELD_NAMES[cls] = frozenset(f.name for f in fields(cls))
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+
+@dataclass(slots=True)
+class User(_FromDict):
     """User/Pilot data model"""
     id: int
     pilot_id: str
@@ -64,8 +81,8 @@ class User:
     updated_at: Optional[str] = None
 
 
-@dataclass
-class Flight:
+@dataclass(slots=True)
+class Flight(_FromDict):
     """Flight data model"""
     id: int
     airline_id: int
@@ -89,8 +106,8 @@ class Flight:
     updated_at: Optional[str] = None
 
 
-@dataclass
-class Pirep:
+@dataclass(slots=True)
+class Pirep(_FromDict):
     """Pilot Report data model"""
     id: int
     user_id: int
@@ -122,8 +139,8 @@ class Pirep:
     submitted_at: Optional[str] = None
 
 
-@dataclass
-class Aircraft:
+@dataclass(slots=True)
+class Aircraft(_FromDict):
     """Aircraft data model"""
     id: int
     subfleet_id: int
@@ -141,8 +158,8 @@ class Aircraft:
     updated_at: Optional[str] = None
 
 
-@dataclass
-class Airport:
+@dataclass(slots=True)
+class Airport(_FromDict):
     """Airport data model"""
     id: str
     iata: Optional[str] = None
@@ -159,8 +176,8 @@ class Airport:
     updated_at: Optional[str] = None
 
 
-@dataclass
-class Airline:
+@dataclass(slots=True)
+class Airline(_FromDict):
     """Airline data model"""
     id: int
     icao: str
@@ -173,8 +190,8 @@ class Airline:
     updated_at: Optional[str] = None
 
 
-@dataclass
-class Bid:
+@dataclass(slots=True)
+class Bid(_FromDict):
     """Flight bid data model"""
     id: int
     user_id: int
@@ -184,8 +201,8 @@ class Bid:
     updated_at: Optional[str] = None
 
 
-@dataclass
-class Acars:
+@dataclass(slots=True)
+class Acars(_FromDict):
     """ACARS data model"""
     id: int
     pirep_id: int
@@ -209,8 +226,8 @@ class Acars:
     updated_at: Optional[str] = None
 
 
-@dataclass
-class PirepComment:
+@dataclass(slots=True)
+class PirepComment(_FromDict):
     """PIREP Comment data model"""
     id: int
     pirep_id: int
@@ -220,8 +237,8 @@ class PirepComment:
     updated_at: Optional[str] = None
 
 
-@dataclass
-class News:
+@dataclass(slots=True)
+class News(_FromDict):
     """News data model"""
     id: int
     user_id: int
@@ -0,0 +1,80 @@
+"""
+PaginationMixin - Prev/Next/Go/page size controls shared by the paginated list widgets
+"""
+from PySide6.QtGui import QIntValidator
+from PySide6.QtWidgets import QHBoxLayout, QPushButton, QLabel, QLineEdit, QComboBox
+
+# (combo text, limit) pairs for the page size selector
+_PAGE_SIZE_ITEMS = tuple((str(n), n) for n in (10, 25, 50, 100))
+
+
+class PaginationMixin:
+    """Pagination state and controls for a QWidget subclass.
+
+    The subclass declares page_change_requested and page_size_change_requested
+    Signal(int)s and adds the layout from _build_pagination_controls() to its UI.
+    """
+
+    _current_page = 1
+    _last_page = 1
+    _total = 0
+    _limit = 25
+
+    def _build_pagination_controls(self) -> QHBoxLayout:
+        row = QHBoxLayout()
+        self.prev_btn = QPushButton("Prev")
+        self.next_btn = QPushButton("Next")
+        self.page_label = QLabel("Page 1/1")
+        self.page_input = QLineEdit()
+        self.page_input.setPlaceholderText("Go to page")
+        self.page_input.setFixedWidth(90)
+        self.page_input.setValidator(QIntValidator(1, 1000000, self))
+        self.page_go_btn = QPushButton("Go")
+        self.page_size_combo = QComboBox()
+        for text, n in _PAGE_SIZE_ITEMS:
+            self.page_size_combo.addItem(text, userData=n)
+        self.page_size_combo.setCurrentText(str(self._limit))
+
+        self.prev_btn.clicked.connect(self._on_prev)
+        self.next_btn.clicked.connect(self._on_next)
+        self.page_size_combo.currentIndexChanged.connect(self._on_page_size_changed)
+        self.page_go_btn.clicked.connect(self._on_go)
+        self.page_input.returnPressed.connect(self._on_go)
+
+        row.addStretch()
+        row.addWidget(self.prev_btn)
+        row.addWidget(self.next_btn)
+        row.addWidget(self.page_label)
+        row.addWidget(self.page_input)
+        row.addWidget(self.page_go_btn)
+        row.addWidget(QLabel("Per page:"))
+        row.addWidget(self.page_size_combo)
+        return row
+
+    def _on_prev(self):
+        self.page_change_requested.emit(max(1, self._current_page - 1))
+
+    def _on_next(self):
+        self.page_change_requested.emit(self._current_page + 1)
+
+    def _on_go(self):
+        try:
+            txt = self.page_input.text().strip()
+            if txt:
+                self.page_change_requested.emit(max(1, int(txt)))
+        except Exception:
+            pass
+
+    def _on_page_size_changed(self):
+        limit = int(self.page_size_combo.currentText())
+        self._limit = limit
+        self.page_size_change_requested.emit(limit)
+
+    def update_pagination(self, current_page: int, last_page: int, total: int):
+        self._current_page = max(1, current_page)
+        self._last_page = max(1, last_page)
+        self._total = max(0, total)
+        self.page_label.setText(f"Page {self._current_page}/{self._last_page} ({self._total})")
+        self.prev_btn.setEnabled(self._current_page > 1)
+        self.next_btn.setEnabled(self._current_page < self._last_page)
+        self.page_input.setText(str(self._current_page))
@@ -8,7 +8,6 @@ Author: Generated for phpVMS API
 Version: 1.0.0
 """
 
-import json
 import logging
 from dataclasses import asdict
 from enum import Enum
@@ -18,6 +17,12 @@ import requests
 
 from models import PirepState
 
+# Response bodies (e.g. whole pages of PIREPs/airports) are parsed with orjson when available
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _json_loads
+
 
 class PhpVmsApiException(Exception):
     """Custom exception for phpVMS API errors"""
@@ -130,10 +135,11 @@ class PhpVmsApiClient:
             if response.headers.get('content-type', '').startswith('application/xml'):
                 return {'data': response.text, 'content_type': 'xml'}
 
-            # Try to parse JSON
+            # Try to parse JSON straight from the raw body bytes
             try:
-                data = response.json()
-            except json.JSONDecodeError:
+                data = _json_loads(response.content)
+            except ValueError:
+                # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
                 data = {'data': response.text}
 
             if not response.ok:
@@ -16,9 +16,12 @@ Requirements:
 """
 
 import json
+import logging
+import queue
 import sys
+import threading
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 import requests
 from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSettings
@@ -27,17 +30,30 @@ from PySide6.QtWidgets import (
     QLabel, QPushButton, QMessageBox, QStatusBar, QProgressBar, QSplitter, QTabWidget
 )
 
-from airports_widget import AirportsWidget
+from airports_widget import AirportsWidget, airport_row
 from bridge_status_widget import BridgeStatusWidget
 from current_flight_widget import CurrentFlightWidget
 from login_widget import LoginWidget
-from pireps_widget import PirepsWidget
+from pireps_widget import PirepsWidget, PirepRow
 from udp_bridge import UdpBridge
 from user_info_widget import UserInfoWidget
-from vms_types import Pirep
 
 NO_ACTIVE_TEXT = "(no active)"
 
+log = logging.getLogger('phpvmsclient.ui')
+
+# Cached user data is (de)serialized on every login and startup; use orjson when available
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 try:
     from phpvms_api_client import create_client, PhpVmsApiException, PirepState, PirepWorkflowManager
 except ImportError as e:
@@ -46,8 +62,27 @@ except ImportError as e:
     sys.exit(1)
 
 
+def _parse_meta(meta: Any, n: int, limit: int) -> Tuple[int, int, int, int]:
+    """Return (current, last, total, per_page) from a paginated response's meta.
+
+    An empty or missing meta is answered without probing it; when the page came
+    back full, one more page is assumed so Next stays enabled.
+    """
+    if not meta or not isinstance(meta, dict):
+        return 1, (1 if n < limit else 2), n, limit
+    current = int(meta.get('current_page') or meta.get('current') or 1)
+    last = int(meta.get('last_page') or meta.get('last') or (current if n < limit else current + 1))
+    total = int(meta.get('total', n))
+    per_page = int(meta.get('per_page', limit))
+    return current, last, total, per_page
+
+
+# Fetch kinds where only the newest queued request matters; older ones are skipped
+_LATEST_ONLY = ("pireps", "airports")
+
+
 class ApiWorker(QThread):
-    """Worker thread for API calls to prevent UI freezing"""
+    """Long-lived worker thread running queued API calls in FIFO order to prevent UI freezing"""
 
     # Signals
     login_result = Signal(bool, str, dict)  # success, message, user_data
@@ -57,63 +92,96 @@ class ApiWorker(QThread):
 
     def __init__(self):
         super().__init__()
-        self.client = None
-        self.operation = None
-        self.base_url = None
-        self.api_key = None
+        # (operation, args) tuples; None is the stop sentinel
+        self._queue: "queue.Queue[Optional[Tuple[str, tuple]]]" = queue.Queue()
+        # Queued, not yet started requests per latest-only kind
+        self._queued_lock = threading.Lock()
+        self._queued: Dict[str, int] = dict.fromkeys(_LATEST_ONLY, 0)
+
+    def _put(self, operation: str, args: tuple):
+        """Queue an operation, starting the thread on first use"""
+        if operation in self._queued:
+            with self._queued_lock:
+                self._queued[operation] += 1
+        self._queue.put((operation, args))
+        if not self.isRunning():
+            self.start()
 
     def set_login_operation(self, base_url: str, api_key: str):
-        """Set up login operation"""
-        self.operation = "login"
-        self.base_url = base_url
-        self.api_key = api_key
+        """Queue login operation"""
+        self._put("login", (base_url, api_key))
 
     def set_pireps_operation(self, client, page: int = 1, limit: int = 50):
-        """Set up PIREPs fetch operation"""
-        self.operation = "pireps"
-        self.client = client
-        self._pireps_page = page
-        self._pireps_limit = limit
+        """Queue PIREPs fetch operation"""
+        self._put("pireps", (client, page, limit))
 
     def set_airports_operation(self, client, page: int = 1, limit: int = 50):
-        """Set up airports fetch operation"""
-        self.operation = "airports"
-        self.client = client
-        self._airports_page = page
-        self._airports_limit = limit
-
+        """Queue airports fetch operation"""
+        self._put("airports", (client, page, limit))
 
     def set_preload_operation(self, client):
-        """Set up preload (airlines and fleet) operation"""
-        self.operation = "preload"
-        self.client = client
+        """Queue preload (airlines and fleet) operation"""
+        self._put("preload", (client,))
+
+    def stop(self):
+        """Drop queued operations and ask the thread to exit after the one in flight"""
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        with self._queued_lock:
+            self._queued = dict.fromkeys(_LATEST_ONLY, 0)
+        self._queue.put(None)
 
     def run(self):
-        """Execute the operation in the background thread"""
+        """Execute queued operations in the background thread until stopped"""
+        while True:
+            op = self._queue.get()
+            if op is None:
+                break
+            operation, args = op
+            if operation in self._queued:
+                with self._queued_lock:
+                    self._queued[operation] -= 1
+                    superseded = self._queued[operation] > 0
+                if superseded:
+                    # A newer fetch of the same kind is queued; answer without the HTTP
+                    # round trip so the UI's pending count still settles
+                    self._emit_failure(operation, "Superseded by a newer request")
+                    continue
+            self._run_operation(operation, args)
+
+    def _emit_failure(self, operation: str, message: str):
+        if operation == "login":
+            self.login_result.emit(False, message, {})
+        elif operation == "pireps":
+            self.pireps_result.emit(False, message, [], {})
+        elif operation == "airports":
+            self.airports_result.emit(False, message, [], {})
+        elif operation == "preload":
+            self.preload_result.emit(False, message, {})
+
+    def _run_operation(self, operation: str, args: tuple):
         try:
-            if self.operation == "login":
-                self._do_login()
-            elif self.operation == "pireps":
-                self._do_fetch_pireps()
-            elif self.operation == "airports":
-                self._do_fetch_airports()
-            elif self.operation == "preload":
-                self._do_preload()
-        except Exception as e:
-            if self.operation == "login":
-                self.login_result.emit(False, f"Unexpected error: {str(e)}", {})
-            elif self.operation == "pireps":
-                self.pireps_result.emit(False, f"Unexpected error: {str(e)}", [], {})
-            elif self.operation == "airports":
-                self.airports_result.emit(False, f"Unexpected error: {str(e)}", [], {})
-            elif self.operation == "preload":
-                self.preload_result.emit(False, f"Unexpected error: {str(e)}", {})
-
-    def _do_login(self):
+            if operation == "login":
+                self._do_login(*args)
+            elif operation == "pireps":
+                self._do_fetch_pireps(*args)
+            elif operation == "airports":
+                self._do_fetch_airports(*args)
+            elif operation == "preload":
+                self._do_preload(*args)
+        except Exception:
+            # Details (with traceback) go to the log; the UI gets a short message
+            log.exception("%s operation failed", operation)
+            self._emit_failure(operation, "Unexpected error (see log)")
+
+    def _do_login(self, base_url: str, api_key: str):
         """Perform login operation"""
         try:
             # Create client
-            client = create_client(self.base_url, api_key=self.api_key)
+            client = create_client(base_url, api_key=api_key)
 
             # Test authentication by getting current user
             response = client.get_current_user()
@@ -129,11 +197,12 @@ class ApiWorker(QThread):
         except Exception as e:
             self.login_result.emit(False, f"Connection error: {str(e)}", {})
 
-    def _do_fetch_pireps(self):
+    def _do_fetch_pireps(self, client, page: int, limit: int):
         """Fetch PIREPs operation"""
         try:
-            response = self.client.get_user_pireps(page=getattr(self, '_pireps_page', 1), limit=getattr(self, '_pireps_limit', 50))
-            pireps_data = response.get('data', [])
+            response = client.get_user_pireps(page=page, limit=limit)
+            # Format rows here so the UI thread only has to display them
+            pireps_data = [PirepRow.from_pirep(p) for p in response.get('data', [])]
             meta = response.get('meta', {}) if isinstance(response, dict) else {}
             self.pireps_result.emit(True, f"Loaded {len(pireps_data)} PIREPs", pireps_data, meta)
 
@@ -142,10 +211,11 @@ class ApiWorker(QThread):
         except Exception as e:
             self.pireps_result.emit(False, f"Error fetching PIREPs: {str(e)}", [], {})
 
-    def _do_fetch_airports(self):
+    def _do_fetch_airports(self, client, page: int, limit: int):
         try:
-            response = self.client.get_airports(page=getattr(self, '_airports_page', 1), limit=getattr(self, '_airports_limit', 50))
-            airports_data = response.get('data', [])
+            response = client.get_airports(page=page, limit=limit)
+            # Format rows here so the UI thread only has to display them
+            airports_data = [airport_row(ap) for ap in response.get('data', [])]
             meta = response.get('meta', {}) if isinstance(response, dict) else {}
             self.airports_result.emit(True, f"Loaded {len(airports_data)} airports", airports_data, meta)
         except PhpVmsApiException as e:
@@ -154,10 +224,10 @@ class ApiWorker(QThread):
             self.airports_result.emit(False, f"Error fetching airports: {str(e)}", [], {})
 
 
-    def _do_preload(self):
+    def _do_preload(self, client):
         try:
-            airlines_resp = self.client.get_airlines()
-            fleet_resp = self.client.get_fleet()
+            airlines_resp = client.get_airlines()
+            fleet_resp = client.get_fleet()
             result = {
                 'airlines': airlines_resp.get('data', []) if isinstance(airlines_resp, dict) else [],
                 'fleet': fleet_resp.get('data', []) if isinstance(fleet_resp, dict) else [],
@@ -228,12 +298,36 @@ class MainWindow(QMainWindow):
         self._active_pirep_id = None
         self.client = None
         self.user_data = None
-        self._workers: List[ApiWorker] = []
         self._inflight_ops = 0
+        # Outstanding fetches per kind; results arrive in FIFO order, so any
+        # result with a newer request still pending is stale and dropped
+        self._pireps_pending = 0
+        self._airports_pending = 0
         self._base_url: Optional[str] = None
         self._api_key: Optional[str] = None
+        # One QSettings for the window; writes are coalesced and flushed together
+        self._settings = QSettings()
+        self._pending_settings: Dict[str, Any] = {}
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(250)
+        self._settings_timer.timeout.connect(self._flush_settings)
+        # Status messages are coalesced so bursts of updates cost one repaint
+        self._pending_status: Optional[str] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status)
         self.setup_ui()
         self.setup_connections()
+        # Single background thread for all API operations, started by the first one queued
+        self._worker = ApiWorker()
+        self._worker.login_result.connect(self.on_login_result)
+        self._worker.pireps_result.connect(self.on_pireps_result)
+        self._worker.airports_result.connect(self.on_airports_result)
+        self._worker.preload_result.connect(self.on_preload_result)
+        # The thread must be finished before it is destroyed, even if the window is never closed
+        QApplication.instance().aboutToQuit.connect(self._stop_worker)
 
     def setup_ui(self):
         """Set up the main UI"""
@@ -298,8 +392,7 @@ class MainWindow(QMainWindow):
         self.tabs.setVisible(False)
 
         # Initialize API debug checkbox from settings
-        settings = QSettings()
-        debug_enabled = bool(settings.value("api/debug", False, type=bool))
+        debug_enabled = bool(self._setting_value("api/debug", False, type=bool))
         try:
             self.bridge_status_widget.set_debug_checked(debug_enabled)
         except Exception:
@@ -309,12 +402,18 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.login_widget)
         layout.addWidget(self.tabs)
 
-        # Initialize page size combos from saved settings
-        try:
-            self.pireps_widget.page_size_combo.setCurrentText(str(self._pireps_limit))
-            self.airports_widget.page_size_combo.setCurrentText(str(self._airports_limit))
-        except Exception:
-            pass
+        # Pagination defaults
+        self._pireps_limit = int(self._setting_value("ui/pireps_limit", 25))
+        self._pireps_page = 1
+        self._airports_limit = int(self._setting_value("ui/airports_limit", 25))
+        self._airports_page = 1
+
+        # Initialize page size combos from saved settings without emitting change requests
+        for combo, limit in ((self.pireps_widget.page_size_combo, self._pireps_limit),
+                             (self.airports_widget.page_size_combo, self._airports_limit)):
+            combo.blockSignals(True)
+            combo.setCurrentText(str(limit))
+            combo.blockSignals(False)
 
         # Progress bar
         self.progress_bar = QProgressBar()
@@ -324,7 +423,7 @@ class MainWindow(QMainWindow):
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Ready - Please login to continue")
+        self._set_status("Ready - Please login to continue")
 
         # Active PIREP summary label (shows route or '(no active)')
         self.active_pirep_label = QLabel(NO_ACTIVE_TEXT)
@@ -340,15 +439,8 @@ class MainWindow(QMainWindow):
         self.logout_button.clicked.connect(self.logout)
         
         # Internal caches and pagination state
-        self._airport_icaos_cache = set()
+        self._airport_icaos_cache = frozenset()
         self._airports_list = []
-        # Pagination defaults
-        settings = QSettings()
-        self._pireps_limit = int(settings.value("ui/pireps_limit", 25))
-        self._pireps_page = 1
-        self._airports_limit = int(settings.value("ui/airports_limit", 25))
-        self._airports_page = 1
-
         # UDP Bridge runtime members
         self._udp_bridge: Optional[UdpBridge] = None
         self._bridge_timer: Optional[QTimer] = None
@@ -389,7 +481,7 @@ class MainWindow(QMainWindow):
         self.pireps_set_active_btn.clicked.connect(self.on_set_active_selected_left)
         # Enable/disable action buttons based on selection presence/state
         try:
-            self.pireps_widget.table.itemSelectionChanged.connect(self._on_pireps_selection_changed)
+            self.pireps_widget.table.selectionModel().selectionChanged.connect(self._on_pireps_selection_changed)
         except Exception:
             pass
 
@@ -403,7 +495,7 @@ class MainWindow(QMainWindow):
         if new_limit <= 0:
             return
         self._pireps_limit = new_limit
-        QSettings().setValue("ui/pireps_limit", new_limit)
+        self._queue_setting("ui/pireps_limit", new_limit)
         self._pireps_page = 1
         self.refresh_pireps()
 
@@ -417,50 +509,21 @@ class MainWindow(QMainWindow):
         if new_limit <= 0:
             return
         self._airports_limit = new_limit
-        QSettings().setValue("ui/airports_limit", new_limit)
+        self._queue_setting("ui/airports_limit", new_limit)
         self._airports_page = 1
         self.refresh_airports()
 
-    def _create_worker(self) -> ApiWorker:
-        """Create a new worker for an operation and wire signals."""
-        worker = ApiWorker()
-        # Connect signals
-        worker.login_result.connect(self.on_login_result)
-        worker.pireps_result.connect(self.on_pireps_result)
-        worker.airports_result.connect(self.on_airports_result)
-        worker.preload_result.connect(self.on_preload_result)
-        # Track and clean up
-        worker.finished.connect(self._on_worker_finished)
-        self._workers.append(worker)
-        return worker
-
-    def _on_worker_finished(self):
-        # Remove finished worker from list
-        sender = self.sender()
-        try:
-            self._workers.remove(sender)  # type: ignore
-        except ValueError:
-            pass
-        # Decrement in-flight ops and hide progress if none left
-        if self._inflight_ops > 0:
-            self._inflight_ops -= 1
-        if self._inflight_ops <= 0:
-            self._inflight_ops = 0
-            self.progress_bar.setVisible(False)
-
     def on_login_requested(self, base_url: str, api_key: str):
         """Handle login request"""
-        self.status_bar.showMessage("Logging in...")
+        self._set_status("Logging in...")
         self.show_progress(True)
         self.login_widget.set_login_enabled(False)
 
         # Store for later client creation
         self._base_url = base_url
         self._api_key = api_key
-        # Start login in a new worker thread
-        worker = self._create_worker()
-        worker.set_login_operation(base_url, api_key)
-        worker.start()
+        # Queue login on the worker thread
+        self._worker.set_login_operation(base_url, api_key)
 
     def on_login_result(self, success: bool, message: str, user_data: Dict[str, Any]):
         """Handle login result"""
@@ -471,18 +534,16 @@ class MainWindow(QMainWindow):
             # Store client and user data
             if self._base_url and self._api_key:
                 # Apply persisted debug flag at client creation
-                settings = QSettings()
-                debug_enabled = bool(settings.value("api/debug", False, type=bool))
+                debug_enabled = bool(self._setting_value("api/debug", False, type=bool))
                 self.client = create_client(self._base_url, api_key=self._api_key, debug=debug_enabled)
             else:
                 # Fallback: try to reconstruct from user settings (shouldn't happen normally)
-                settings = QSettings()
-                base_url = str(settings.value("api/base_url", ""))
-                api_key = str(settings.value("api/api_key", ""))
+                base_url = str(self._setting_value("api/base_url", ""))
+                api_key = str(self._setting_value("api/api_key", ""))
                 if base_url and api_key:
                     if not base_url.startswith(("http://", "https://")):
                         base_url = "https://" + base_url
-                    debug_enabled = bool(settings.value("api/debug", False, type=bool))
+                    debug_enabled = bool(self._setting_value("api/debug", False, type=bool))
                     self.client = create_client(base_url, api_key=api_key, debug=debug_enabled)
             self.user_data = user_data
             # Initialize workflow manager
@@ -493,16 +554,15 @@ class MainWindow(QMainWindow):
 
             # Save user_data to cache to avoid future login network calls
             try:
-                settings = QSettings()
-                settings.setValue("api/user_data", json.dumps(user_data))
-                settings.setValue("api/user_cached_at", datetime.utcnow().isoformat() + "Z")
+                self._queue_setting("api/user_data", _json_dumps(user_data))
+                self._queue_setting("api/user_cached_at", datetime.utcnow().isoformat() + "Z")
             except Exception:
                 pass
 
             # Update UI
             self.user_info_widget.update_user_info(user_data)
             self.show_main_interface()
-            self.status_bar.showMessage(f"Logged in as {user_data.get('name', 'Unknown')}")
+            self._set_status(f"Logged in as {user_data.get('name', 'Unknown')}")
 
             # Preload data for tabs
             self.preload_reference_data()
@@ -512,7 +572,7 @@ class MainWindow(QMainWindow):
             self.refresh_pireps()
         else:
             QMessageBox.critical(self, "Login Failed", message)
-            self.status_bar.showMessage("Login failed")
+            self._set_status("Login failed")
 
     def show_main_interface(self):
         """Switch to main interface after successful login"""
@@ -551,8 +611,7 @@ class MainWindow(QMainWindow):
 
     def _on_debug_toggled(self, enabled: bool):
         """Persist and apply API debug logging immediately."""
-        settings = QSettings()
-        settings.setValue("api/debug", bool(enabled))
+        self._queue_setting("api/debug", bool(enabled))
         # Reflect state in the checkbox without feedback loops
         try:
             self.bridge_status_widget.set_debug_checked(bool(enabled))
@@ -570,67 +629,65 @@ class MainWindow(QMainWindow):
         if not self.client:
             return
 
-        self.status_bar.showMessage("Loading PIREPs...")
+        self._set_status("Loading PIREPs...")
         self.show_progress(True)
         try:
             self.pireps_refresh_btn.setEnabled(False)
         except Exception:
             pass
 
-        # Start PIREPs fetch in its own worker thread
-        worker = self._create_worker()
-        worker.set_pireps_operation(self.client, page=getattr(self, '_pireps_page', 1), limit=getattr(self, '_pireps_limit', 25))
-        worker.start()
+        # Queue PIREPs fetch on the worker thread
+        self._pireps_pending += 1
+        self._worker.set_pireps_operation(self.client, page=self._pireps_page, limit=self._pireps_limit)
 
     def refresh_airports(self):
         if not self.client:
             return
-        self.status_bar.showMessage("Loading airports...")
+        self._set_status("Loading airports...")
         self.show_progress(True)
         self.airports_widget.set_refresh_enabled(False)
-        worker = self._create_worker()
-        worker.set_airports_operation(self.client, page=getattr(self, '_airports_page', 1), limit=getattr(self, '_airports_limit', 25))
-        worker.start()
+        self._airports_pending += 1
+        self._worker.set_airports_operation(self.client, page=self._airports_page, limit=self._airports_limit)
 
 
-    def on_airports_result(self, success: bool, message: str, airports_data: List[Dict[str, Any]], meta: Dict[str, Any]):
+    def on_airports_result(self, success: bool, message: str, airports_data: List[Tuple[str, ...]], meta: Dict[str, Any]):
         self.show_progress(False)
+        self._airports_pending = max(0, self._airports_pending - 1)
+        if self._airports_pending:
+            # A newer airports request is queued behind this one
+            return
         self.airports_widget.set_refresh_enabled(True)
         if success:
-            self._airports_list = airports_data
-            # Update cache set
-            self._airport_icaos_cache = set()
-            for ap in airports_data:
-                icao = ap.get('icao') or ap.get('id') or ap.get('icao_code') or ap.get('icao_id')
-                if isinstance(icao, str):
-                    self._airport_icaos_cache.add(icao.upper())
-            self.airports_widget.update_airports(airports_data)
+            # An identical page (e.g. a plain Refresh) leaves the cache and table as they are
+            if airports_data != self._airports_list:
+                self._airports_list = airports_data
+                # Column 0 is the ICAO already resolved via the key-priority tuple
+                self._airport_icaos_cache = frozenset(row[0].upper() for row in airports_data if row[0])
+                self.airports_widget.update_airports(airports_data)
             # Update pagination controls based on meta
-            current = int(meta.get('current_page') or meta.get('current') or 1)
-            last = int(meta.get('last_page') or meta.get('last') or (current if len(airports_data) < self._airports_limit else current + 1))
-            total = int(meta.get('total', len(airports_data))) if isinstance(meta, dict) else len(airports_data)
+            current, last, total, per_page = _parse_meta(meta, len(airports_data), self._airports_limit)
             self._airports_page = max(1, current)
             self.airports_widget.update_pagination(current, last, total)
-            per_page = int(meta.get('per_page', self._airports_limit)) if isinstance(meta, dict) else self._airports_limit
             self._airports_limit = per_page
+            # Reflect per_page without re-emitting a page size change (and refetching)
+            combo = self.airports_widget.page_size_combo
+            combo.blockSignals(True)
             try:
-                self.airports_widget.page_size_combo.setCurrentText(str(per_page))
-            except Exception:
-                pass
-            self.status_bar.showMessage(message)
+                combo.setCurrentText(str(per_page))
+            finally:
+                combo.blockSignals(False)
+            self._set_status(message)
         else:
             QMessageBox.warning(self, "Error", f"Failed to load airports: {message}")
-            self.status_bar.showMessage("Failed to load airports")
+            self._set_status("Failed to load airports")
 
 
     def preload_reference_data(self):
         if not self.client:
             return
-        self.status_bar.showMessage("Loading reference data...")
+        self._set_status("Loading reference data...")
         self.show_progress(True)
-        worker = self._create_worker()
-        worker.set_preload_operation(self.client)
-        worker.start()
+        self._worker.set_preload_operation(self.client)
 
     def on_preload_result(self, success: bool, message: str, data: Dict[str, Any]):
         self.show_progress(False)
@@ -648,14 +705,18 @@ class MainWindow(QMainWindow):
                     if not isinstance(aircraft_list, list):
                         aircraft_list = []
             self.current_flight_widget.set_fleet(aircraft_list)
-            self.status_bar.showMessage(message)
+            self._set_status(message)
         else:
             QMessageBox.warning(self, "Error", f"Failed to preload data: {message}")
-            self.status_bar.showMessage("Failed to preload data")
+            self._set_status("Failed to preload data")
 
-    def on_pireps_result(self, success: bool, message: str, pireps_data: List[Pirep], meta: Dict[str, Any]):
+    def on_pireps_result(self, success: bool, message: str, pireps_data: List[PirepRow], meta: Dict[str, Any]):
         """Handle PIREPs result"""
         self.show_progress(False)
+        self._pireps_pending = max(0, self._pireps_pending - 1)
+        if self._pireps_pending:
+            # A newer PIREPs request is queued behind this one
+            return
         try:
             self.pireps_refresh_btn.setEnabled(True)
         except Exception:
@@ -669,15 +730,17 @@ class MainWindow(QMainWindow):
 
         if success:
             self.pireps_widget.update_pireps(pireps_data)
+            # A reloaded table has no selection; an unchanged one may keep it
+            self._on_pireps_selection_changed()
             # Update active route label based on current active ID
             try:
                 text_set = False
                 if self._active_pirep_id:
                     for pr in pireps_data:
                         try:
-                            if str(pr.get('id')) == str(self._active_pirep_id):
-                                dep = str(pr.get('dpt_airport_id') or "").upper()
-                                arv = str(pr.get('arr_airport_id') or "").upper()
+                            if str(pr.id) == str(self._active_pirep_id):
+                                dep = str(pr.dpt_airport_id or "").upper()
+                                arv = str(pr.arr_airport_id or "").upper()
                                 if dep and arv:
                                     self.active_pirep_label.setText(f"{dep} → {arv}")
                                     text_set = True
@@ -689,22 +752,22 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             # Update pagination controls based on meta
-            current = int(meta.get('current_page') or meta.get('current') or 1)
-            last = int(meta.get('last_page') or meta.get('last') or (current if len(pireps_data) < self._pireps_limit else current + 1))
-            total = int(meta.get('total', len(pireps_data))) if isinstance(meta, dict) else len(pireps_data)
+            current, last, total, per_page = _parse_meta(meta, len(pireps_data), self._pireps_limit)
             self._pireps_page = max(1, current)
             self.pireps_widget.update_pagination(current, last, total)
-            # Update page size combo to reflect per_page if provided
-            per_page = int(meta.get('per_page', self._pireps_limit)) if isinstance(meta, dict) else self._pireps_limit
             self._pireps_limit = per_page
+            # Update page size combo to reflect per_page, without re-emitting a
+            # page size change (and refetching)
+            combo = self.pireps_widget.page_size_combo
+            combo.blockSignals(True)
             try:
-                self.pireps_widget.page_size_combo.setCurrentText(str(per_page))
-            except Exception:
-                pass
-            self.status_bar.showMessage(message)
+                combo.setCurrentText(str(per_page))
+            finally:
+                combo.blockSignals(False)
+            self._set_status(message)
         else:
             QMessageBox.warning(self, "Error", f"Failed to load PIREPs: {message}")
-            self.status_bar.showMessage("Failed to load PIREPs")
+            self._set_status("Failed to load PIREPs")
 
     def on_import_simbrief_clicked(self):
         """Fetch SimBrief OFP JSON and populate current flight fields."""
@@ -714,12 +777,12 @@ class MainWindow(QMainWindow):
                 QMessageBox.information(self, "SimBrief", "Please enter your SimBrief ID.")
                 return
             try:
-                QSettings().setValue("simbrief/userid", sb_id)
+                self._queue_setting("simbrief/userid", sb_id)
             except Exception:
                 pass
             # Build URL
             url = f"https://www.simbrief.com/api/xml.fetcher.php?userid={sb_id}&json=1"
-            self.status_bar.showMessage("Importing SimBrief...")
+            self._set_status("Importing SimBrief...")
             self.show_progress(True)
             try:
                 self.current_flight_widget.import_simbrief_button.setEnabled(False)
@@ -735,7 +798,7 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             QMessageBox.warning(self, "SimBrief Import Failed", str(e))
-            self.status_bar.showMessage("SimBrief import failed")
+            self._set_status("SimBrief import failed")
             return
         finally:
             pass
@@ -786,7 +849,7 @@ class MainWindow(QMainWindow):
             if simbrief_flight_number:
                 self.current_flight_widget.simbrief_flight_number_input.setText(simbrief_flight_number)
 
-            self.status_bar.showMessage("SimBrief OFP imported")
+            self._set_status("SimBrief OFP imported")
         finally:
             self.show_progress(False)
             try:
@@ -879,9 +942,9 @@ class MainWindow(QMainWindow):
                     self.user_data['last_pirep_id'] = pid
             except Exception:
                 pass
-            self.status_bar.showMessage(f"Prefiled PIREP #{pid} (IN_PROGRESS)")
+            self._set_status(f"Prefiled PIREP #{pid} (IN_PROGRESS)")
         except Exception:
-            self.status_bar.showMessage("Prefiled PIREP (id unknown)")
+            self._set_status("Prefiled PIREP (id unknown)")
 
     def update_active_route_label(self, arr, dpt, pirep_data):
         try:
@@ -921,7 +984,7 @@ class MainWindow(QMainWindow):
             self.active_pirep_label.setText(NO_ACTIVE_TEXT)
         except Exception:
             pass
-        self.status_bar.showMessage(f"Cancelled PIREP #{pid}")
+        self._set_status(f"Cancelled PIREP #{pid}")
 
     def on_file_clicked(self):
         if not self._workflow:
@@ -947,7 +1010,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "File failed", str(e))
             return
         self.show_progress(False)
-        self.status_bar.showMessage(f"Filed PIREP #{pid} (PENDING)")
+        self._set_status(f"Filed PIREP #{pid} (PENDING)")
         self._active_pirep_id = None
         self._initial_block_fuel_kg = None
         try:
@@ -976,7 +1039,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Cancel failed", str(e))
         finally:
             self.show_progress(False)
-        self.status_bar.showMessage(f"Cancelled PIREP {pid}")
+        self._set_status(f"Cancelled PIREP {pid}")
         # Refresh PIREPs list to reflect state change
         self.refresh_pireps()
 
@@ -1013,7 +1076,7 @@ class MainWindow(QMainWindow):
                 self.active_pirep_label.setText(NO_ACTIVE_TEXT)
         except Exception:
             self.active_pirep_label.setText(NO_ACTIVE_TEXT)
-        self.status_bar.showMessage(f"Active PIREP set to #{pid}")
+        self._set_status(f"Active PIREP set to #{pid}")
 
     def _on_pireps_selection_changed(self):
         """Enable/disable the left-pane action buttons based on selection validity/state."""
@@ -1061,7 +1124,7 @@ class MainWindow(QMainWindow):
         self.login_widget.setVisible(True)
 
         # Clear status
-        self.status_bar.showMessage("Ready - Please login to continue")
+        self._set_status("Ready - Please login to continue")
         try:
             self.active_pirep_label.setVisible(False)
             self.active_pirep_label.setText(NO_ACTIVE_TEXT)
@@ -1196,6 +1259,51 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _set_status(self, message: str):
+        """Show a status bar message; only the latest within a short window is painted."""
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        if self._pending_status is not None:
+            self.status_bar.showMessage(self._pending_status)
+            self._pending_status = None
+
+    def _setting_value(self, key: str, default: Any = None, **kwargs) -> Any:
+        """Read a setting, seeing writes that are still queued for flushing."""
+        if key in self._pending_settings:
+            return self._pending_settings[key]
+        return self._settings.value(key, default, **kwargs)
+
+    def _queue_setting(self, key: str, value: Any):
+        """Stage a settings write; bursts are flushed together by a short timer."""
+        self._pending_settings[key] = value
+        self._settings_timer.start()
+
+    def _flush_settings(self):
+        if not self._pending_settings:
+            return
+        for key, value in self._pending_settings.items():
+            self._settings.setValue(key, value)
+        self._pending_settings.clear()
+        self._settings.sync()
+
+    def _stop_worker(self):
+        """Stop the API worker and wait for it; only the operation in flight is finished first."""
+        if self._worker.isRunning():
+            self._worker.stop()
+            self._worker.wait()
+
+    def closeEvent(self, event):
+        """Stop the API worker thread and persist pending settings before the window goes away."""
+        self._stop_worker()
+        self._settings_timer.stop()
+        self._flush_settings()
+        # Embedded widgets get no close event of their own; let the simulator persist and clean up
+        self.bridge_status_widget.sim_widget.close()
+        super().closeEvent(event)
+
     def show_progress(self, show: bool):
         """Refcounted progress indicator across concurrent operations."""
         if show:
@@ -1221,23 +1329,22 @@ class MainWindow(QMainWindow):
         self._api_key = api_key
 
         # Load cached user_data
-        settings = QSettings()
-        cached_user_json = settings.value("api/user_data", "")
+        cached_user_json = self._setting_value("api/user_data", "")
         user_data = None
         if isinstance(cached_user_json, str) and cached_user_json.strip():
             try:
-                user_data = json.loads(cached_user_json)
+                user_data = _json_loads(cached_user_json)
             except Exception:
                 user_data = None
 
         if user_data:
             # Use cached user data; avoid calling get_current_user
-            debug_enabled = bool(settings.value("api/debug", False, type=bool))
+            debug_enabled = bool(self._setting_value("api/debug", False, type=bool))
             self.client = create_client(base_url, api_key=api_key, debug=debug_enabled)
             self.user_data = user_data
             self.user_info_widget.update_user_info(user_data)
             self.show_main_interface()
-            self.status_bar.showMessage(f"Logged in (cached) as {user_data.get('name', 'Unknown')}")
+            self._set_status(f"Logged in (cached) as {user_data.get('name', 'Unknown')}")
 
             # Proceed to load other data
             self.preload_reference_data()
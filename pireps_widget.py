@@ -1,26 +1,165 @@
 """
 PirepsWidget - lists PIREPs, supports selection helpers and pagination
 """
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from PySide6.QtCore import Signal
-from PySide6.QtGui import QIntValidator
-from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QComboBox, QTableWidget, QHeaderView, QMessageBox, QTableWidgetItem
-)
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QTableView, QHeaderView, QMessageBox
 
+from pagination import PaginationMixin
 from vms_types import Pirep
 
 try:
     from phpvms_api_client import PirepState
+    # State value -> name, built once instead of constructing the enum per row
+    _PIREP_STATE_NAMES: Dict[int, str] = {int(m.value): m.name for m in PirepState}
 except Exception:  # pragma: no cover
     class PirepState:  # type: ignore
         IN_PROGRESS = type("EnumValue", (), {"value": 0})
+    _PIREP_STATE_NAMES = {}
+
+# fromisoformat() accepts a trailing 'Z' from 3.11 on; older versions need it spelled as an offset
+_ISO_Z_NATIVE = sys.version_info >= (3, 11)
+
+_HEADERS = ("Route", "State", "Date", "Duration", "Dist. (nm)")
+# Role the sort proxy orders by: numeric keys for Duration/Distance, the text elsewhere
+_SORT_ROLE = Qt.UserRole
+
+
+def _fmt_iso(ts: str) -> str:
+    """Format an ISO-8601 timestamp as 'YYYY-MM-DD HH:MM'.
+
+    The common 'YYYY-MM-DDTHH:MM...' shape is sliced directly; anything else is
+    parsed, and returned unchanged if it cannot be.
+    """
+    if len(ts) >= 16 and ts[10] in 'T ' and ts[13] == ':':
+        return f"{ts[:10]} {ts[11:16]}"
+    try:
+        if not _ISO_Z_NATIVE and ts[-1:] == 'Z':
+            ts = ts[:-1] + '+00:00'
+        return datetime.fromisoformat(ts).strftime('%Y-%m-%d %H:%M')
+    except Exception:
+        return ts
+
+
+@dataclass(slots=True)
+class PirepRow:
+    """Display-ready PIREP table row, formatted once from the API payload"""
+    id: Any
+    state: Optional[int]
+    dpt_airport_id: Any
+    arr_airport_id: Any
+    route: str
+    state_name: str
+    date_str: str
+    duration: str
+    distance: str
+    # Numeric sort keys for the Duration/Distance columns (-1 when N/A)
+    duration_key: float = -1.0
+    distance_key: float = -1.0
+
+    @classmethod
+    def from_pirep(cls, pirep: Pirep) -> "PirepRow":
+        try:
+            pid = pirep.get('id')
+        except Exception:
+            pid = "-"
+
+        # State for selection logic
+        state_value = pirep.get('state', 0)
+        try:
+            state_int = int(state_value)
+        except Exception:
+            state_int = None
+
+        # Route
+        dep = pirep.get('dpt_airport_id', '')
+        arr = pirep.get('arr_airport_id', '')
+        route = f"{dep} → {arr}" if dep and arr else "N/A"
+
+        # State name
+        state_name = _PIREP_STATE_NAMES.get(state_int, f"Unknown ({state_value})")
+
+        # Date
+        created_at = pirep.get('created_at', '')
+        date_str = _fmt_iso(created_at) if created_at else 'N/A'
+
+        # Flight time
+        flight_time = pirep.get('flight_time', 0)
+        if flight_time:
+            hours = flight_time // 60
+            minutes = flight_time % 60
+            time_str = f"{hours}h {minutes}m"
+        else:
+            time_str = 'N/A'
+
+        # Distance (nm)
+        distance = pirep.get('distance', {}).get('nmi', -1)
+        try:
+            if distance is None or distance == 0:
+                distance_value = None
+            elif isinstance(distance, (int, float)):
+                distance_value = float(distance)
+            elif isinstance(distance, str) and distance.strip() != "":
+                distance_value = float(distance)
+            else:
+                distance_value = None
+        except Exception:
+            distance_value = None
+        distance_str = f"{distance_value:.0f}" if distance_value is not None else 'N/A'
 
+        return cls(pid, state_int, dep, arr, route, state_name, date_str, time_str, distance_str,
+                   duration_key=float(flight_time) if flight_time else -1.0,
+                   distance_key=distance_value if distance_value is not None else -1.0)
 
-class PirepsWidget(QWidget):
+
+class PirepsTableModel(QAbstractTableModel):
+    """Read-only model over PirepRow objects, already formatted by PirepRow.from_pirep"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[PirepRow] = []
+
+    def set_rows(self, rows: List[PirepRow]) -> bool:
+        """Replace the rows; returns False, without a reset, if they equal the current ones."""
+        if rows == self._rows:
+            return False
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        return True
+
+    def row_at(self, row: int) -> Optional[PirepRow]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.DisplayRole or (role == _SORT_ROLE and col < 3):
+            r = self._rows[index.row()]
+            return (r.route, r.state_name, r.date_str, r.duration, r.distance)[col]
+        if role == _SORT_ROLE:
+            r = self._rows[index.row()]
+            return r.duration_key if col == 3 else r.distance_key
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return _HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class PirepsWidget(PaginationMixin, QWidget):
     """Widget to display PIREPs table"""
 
     refresh_requested = Signal()
@@ -30,225 +169,93 @@ class PirepsWidget(QWidget):
 
     def __init__(self):
         super().__init__()
-        self._current_page = 1
-        self._last_page = 1
-        self._total = 0
-        self._limit = 25
         self._row_pirep_ids: List[str] = []
         self._row_states: List[Optional[int]] = []
+        # Refresh lives in the main window's left pane; set if this widget ever gets its own
+        self.refresh_button: Optional[QPushButton] = None
         self.setup_ui()
 
     def setup_ui(self):
         """Set up the PIREPs UI"""
         layout = QVBoxLayout()
 
-        # Header with refresh + pagination controls
-        header_layout = QHBoxLayout()
-        header_layout.addStretch()
-
         # Pagination controls
-        self.prev_btn = QPushButton("Prev")
-        self.next_btn = QPushButton("Next")
-        self.page_label = QLabel("Page 1/1")
-        self.page_size_combo = QComboBox()
-        for n in [10, 25, 50, 100]:
-            self.page_size_combo.addItem(str(n), userData=n)
-        self.page_size_combo.setCurrentText(str(self._limit))
-        self.prev_btn.clicked.connect(lambda: self.page_change_requested.emit(max(1, self._current_page - 1)))
-        self.next_btn.clicked.connect(lambda: self.page_change_requested.emit(self._current_page + 1))
-        self.page_size_combo.currentIndexChanged.connect(self._on_page_size_changed)
-
-        header_layout.addWidget(self.prev_btn)
-        header_layout.addWidget(self.next_btn)
-        header_layout.addWidget(self.page_label)
-        self.page_input = QLineEdit()
-        self.page_input.setPlaceholderText("Go to page")
-        self.page_input.setFixedWidth(90)
-        self.page_input.setValidator(QIntValidator(1, 1000000, self))
-        self.page_go_btn = QPushButton("Go")
-
-        def _emit_go_pireps():
-            try:
-                txt = self.page_input.text().strip()
-                if txt:
-                    self.page_change_requested.emit(max(1, int(txt)))
-            except Exception:
-                pass
-
-        self.page_go_btn.clicked.connect(_emit_go_pireps)
-        self.page_input.returnPressed.connect(_emit_go_pireps)
-        header_layout.addWidget(self.page_input)
-        header_layout.addWidget(self.page_go_btn)
-        header_layout.addWidget(QLabel("Per page:"))
-        header_layout.addWidget(self.page_size_combo)
-
-        # Note: Refresh and Cancel Selected buttons moved to left User Information pane for better space usage
-        layout.addLayout(header_layout)
-
-        # PIREPs table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "Route", "State", "Date", "Duration", "Dist. (nm)"
-        ])
+        # Note: Refresh and Cancel Selected buttons live in the left User Information pane
+        layout.addLayout(self._build_pagination_controls())
+
+        # PIREPs table; cells come from the model, sorting goes through the proxy
+        self.model = PirepsTableModel(self)
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self.model)
+        self._proxy.setSortRole(_SORT_ROLE)
+        self.table = QTableView()
+        self.table.setModel(self._proxy)
 
         # Configure table
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         self.table.setSortingEnabled(True)
+        # Keep the server's order until a header is clicked
+        header.setSortIndicator(-1, Qt.AscendingOrder)
 
         layout.addWidget(self.table)
 
         self.setLayout(layout)
 
+    def _selected_row(self) -> int:
+        """Model row of the current table row (the view may be sorted), or -1."""
+        index = self.table.currentIndex()
+        if not index.isValid():
+            return -1
+        return self._proxy.mapToSource(index).row()
+
     def _on_cancel_selected_clicked(self):
-        selected = self.table.selectedItems()
-        if not selected:
+        if not self.table.selectionModel().hasSelection():
             QMessageBox.information(self, "No selection", "Please select a PIREP row to cancel.")
             return
-        row = self.table.currentRow()
+        row = self._selected_row()
         if row < 0 or row >= len(self._row_pirep_ids):
             QMessageBox.warning(self, "Invalid selection", "Could not determine selected PIREP.")
             return
-        pid = self._row_pirep_ids[row] if row < len(self._row_pirep_ids) else ""
+        pid = self._row_pirep_ids[row]
         if not isinstance(pid, str) or not pid.strip():
             QMessageBox.warning(self, "Invalid PIREP", "Selected PIREP has no valid ID.")
             return
         self.cancel_selected_requested.emit(pid)
 
-    def _on_page_size_changed(self):
-        limit = int(self.page_size_combo.currentText())
-        self._limit = limit
-        self.page_size_change_requested.emit(limit)
-
-    def update_pagination(self, current_page: int, last_page: int, total: int):
-        self._current_page = max(1, current_page)
-        self._last_page = max(1, last_page)
-        self._total = max(0, total)
-        self.page_label.setText(f"Page {self._current_page}/{self._last_page} ({self._total})")
-        self.prev_btn.setEnabled(self._current_page > 1)
-        self.next_btn.setEnabled(self._current_page < self._last_page)
-        try:
-            self.page_input.setText(str(self._current_page))
-        except Exception:
-            pass
-
-    def update_pireps(self, pireps_data: List[Pirep]):
-        self.table.setRowCount(len(pireps_data))
-        self._row_pirep_ids = []
-        self._row_states = []
-
-        for row, pirep in enumerate(pireps_data):
-            try:
-                pid = pirep.get('id')
-            except Exception:
-                pid = "-"
-            self._row_pirep_ids.append(pid)
-
-            # State for selection logic
-            state_value = pirep.get('state', 0)
-            try:
-                state_int = int(state_value)
-            except Exception:
-                state_int = None
-            self._row_states.append(state_int)
-
-            # Route
-            dep = pirep.get('dpt_airport_id', '')
-            arr = pirep.get('arr_airport_id', '')
-            route = f"{dep} → {arr}" if dep and arr else "N/A"
-            self.table.setItem(row, 0, QTableWidgetItem(route))
-
-            # State name
-            state_value = pirep.get('state', 0)
-            try:
-                state_name = PirepState(state_value).name
-            except Exception:
-                state_name = f"Unknown ({state_value})"
-            self.table.setItem(row, 1, QTableWidgetItem(state_name))
-
-            # Date
-            created_at = pirep.get('created_at', '')
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    date_str = dt.strftime('%Y-%m-%d %H:%M')
-                except Exception:
-                    date_str = created_at
-            else:
-                date_str = 'N/A'
-            self.table.setItem(row, 2, QTableWidgetItem(date_str))
-
-            # Flight time
-            flight_time = pirep.get('flight_time', 0)
-            if flight_time:
-                hours = flight_time // 60
-                minutes = flight_time % 60
-                time_str = f"{hours}h {minutes}m"
-            else:
-                time_str = 'N/A'
-            self.table.setItem(row, 3, QTableWidgetItem(time_str))
-
-            # Distance (nm)
-            distance = pirep.get('distance', {}).get('nmi', -1)
-            try:
-                if distance is None or distance == 0:
-                    distance_value = None
-                elif isinstance(distance, (int, float)):
-                    distance_value = float(distance)
-                elif isinstance(distance, str) and distance.strip() != "":
-                    distance_value = float(distance)
-                else:
-                    distance_value = None
-            except Exception:
-                distance_value = None
-            distance_str = f"{distance_value:.0f}" if distance_value is not None else 'N/A'
-            self.table.setItem(row, 4, QTableWidgetItem(distance_str))
+    def update_pireps(self, rows: List[PirepRow]):
+        # An identical page (e.g. a plain Refresh) keeps the table, its sort and the selection
+        if not self.model.set_rows(rows):
+            return
+        # Indexed by model row, which get_selected_* map the view's row back to
+        self._row_pirep_ids = [r.id for r in rows]
+        self._row_states = [r.state for r in rows]
 
     def set_refresh_enabled(self, enabled: bool):
-        try:
-            if hasattr(self, 'refresh_button') and self.refresh_button is not None:
-                self.refresh_button.setEnabled(enabled)
-        except Exception:
-            pass
+        if self.refresh_button is not None:
+            self.refresh_button.setEnabled(enabled)
 
     def get_selected_pirep_id(self) -> Optional[str]:
-        try:
-            row = self.table.currentRow()
-            if row is None or row < 0:
-                return None
-            if row >= len(self._row_pirep_ids):
-                return None
-            pid = self._row_pirep_ids[row]
-            if isinstance(pid, str) and pid.strip():
-                return pid
-            return None
-        except Exception:
+        row = self._selected_row()
+        if row < 0 or row >= len(self._row_pirep_ids):
             return None
+        pid = self._row_pirep_ids[row]
+        if isinstance(pid, str) and pid.strip():
+            return pid
+        return None
 
     def get_selected_pirep_state(self) -> Optional[int]:
-        try:
-            row = self.table.currentRow()
-            if row is None or row < 0:
-                return None
-            if row >= len(self._row_states):
-                return None
-            return self._row_states[row]
-        except Exception:
+        row = self._selected_row()
+        if row < 0 or row >= len(self._row_states):
             return None
+        return self._row_states[row]
 
     def get_selected_route(self) -> Optional[str]:
         """Return the 'Route' cell text (e.g., "DEP → ARR") for the selected row, if any."""
-        try:
-            row = self.table.currentRow()
-            if row is None or row < 0:
-                return None
-            item = self.table.item(row, 0)
-            if item is None:
-                return None
-            text = item.text().strip()
-            return text if text else None
-        except Exception:
+        r = self.model.row_at(self._selected_row())
+        if r is None:
             return None
+        text = r.route.strip()
+        return text if text else None
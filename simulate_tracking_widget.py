@@ -20,41 +20,117 @@ parent via set_port_getter, default 47777 if not provided.
 """
 from __future__ import annotations
 
-import json
 import socket
-from datetime import datetime, timezone
-from typing import Callable, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QSettings
+from PySide6.QtCore import Qt, QSettings, QTimer
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QDoubleSpinBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QComboBox, QDoubleSpinBox,
     QSpinBox, QPushButton, QGroupBox
 )
 
+# Packet JSON as the bridge expects it. The shape never changes, so values are
+# %-formatted into this template instead of building and encoding a dict per send.
+# fuel is kilograms remaining; flight_time is whole minutes, as the Lua client sends it.
+_PACKET_TEMPLATE = (
+    '{"status":"%s","position":{"lat":%.6f,"lon":%.6f,"altitude_msl":%d,"altitude_agl":%d,'
+    '"gs":%d,"sim_time":"%s","distance":%.1f,"ias":%d,"vs":%d},"fuel":%.1f,"flight_time":%d}'
+)
+
+# Info label text after a successful send
+_INFO_TEMPLATE = "Sent %s%s to %s:%d lat=%.6f lon=%.6f dist=%.1fnm fuel=%.1fkg%s"
+
 try:
-    from phpvms_api_client import PirepStatus as _PirepStatus
+    from phpvms_api_client import PirepStatus
+    _status_pairs = [(m.name, m.value) for m in PirepStatus]
 except Exception:
-    # Fallback: lightweight stub if import fails in design-time
-    class _PirepStatus:  # type: ignore
-        INITIATED = type("E", (), {"value": "INI", "name": "INITIATED"})
-        BOARDING = type("E", (), {"value": "BST", "name": "BOARDING"})
-        DEPARTED = type("E", (), {"value": "OFB", "name": "DEPARTED"})
-        TAXI = type("E", (), {"value": "TXI", "name": "TAXI"})
-        TAKEOFF = type("E", (), {"value": "TOF", "name": "TAKEOFF"})
-        AIRBORNE = type("E", (), {"value": "TKO", "name": "AIRBORNE"})
-        ENROUTE = type("E", (), {"value": "ENR", "name": "ENROUTE"})
-        APPROACH = type("E", (), {"value": "TEN", "name": "APPROACH"})
-        LANDING = type("E", (), {"value": "LDG", "name": "LANDING"})
-        LANDED = type("E", (), {"value": "LAN", "name": "LANDED"})
-        ARRIVED = type("E", (), {"value": "ARR", "name": "ARRIVED"})
-        CANCELLED = type("E", (), {"value": "DX", "name": "CANCELLED"})
-        PAUSED = type("E", (), {"value": "PSD", "name": "PAUSED"})
+    # Fallback for design-time use without the API client; mirrors PirepStatus
+    _status_pairs = [
+        ("INITIATED", "INI"), ("BOARDING", "BST"), ("DEPARTED", "OFB"), ("TAXI", "TXI"),
+        ("TAKEOFF", "TOF"), ("AIRBORNE", "TKO"), ("ENROUTE", "ENR"), ("APPROACH", "TEN"),
+        ("LANDING", "LDG"), ("LANDED", "LAN"), ("ARRIVED", "ARR"), ("CANCELLED", "DX"),
+        ("PAUSED", "PSD"),
+    ]
+
+# (name, code) entries for the status combo, sorted by code; built once at import
+_STATUS_ITEMS: Tuple[Tuple[str, str], ...] = tuple(sorted(_status_pairs, key=lambda x: x[1]))
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as 'YYYY-MM-DDTHH:MM:SS.ffffffZ', formatted without strftime."""
+    secs, us = divmod(time.time_ns() // 1000, 1_000_000)
+    t = time.gmtime(secs)
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{us:06d}Z")
+
+
+def _compute_step(lat: float, lon: float, dist: float, fuel: float,
+                  dlat: float, dlon: float, ddist: float, dfuel: float) -> Tuple[float, float, float, float]:
+    """Advance one simulated step: clamp latitude, wrap longitude, keep dist/fuel non-negative."""
+    lat += dlat
+    lat = -90.0 if lat < -90.0 else 90.0 if lat > 90.0 else lat
+    # Wrap into [-180, 180)
+    lon = ((lon + dlon + 180.0) % 360.0) - 180.0
+    dist += ddist
+    fuel += dfuel
+    return lat, lon, (dist if dist > 0.0 else 0.0), (fuel if fuel > 0.0 else 0.0)
+
+
+def _spin(lo: int, hi: int, value: int, step: int = 1) -> QSpinBox:
+    spin = QSpinBox()
+    spin.setRange(lo, hi)
+    spin.setValue(value)
+    spin.setSingleStep(step)
+    return spin
+
+
+def _double_spin(lo: float, hi: float, value: float, step: float, decimals: int,
+                 min_width: int = 0) -> QDoubleSpinBox:
+    spin = QDoubleSpinBox()
+    spin.setDecimals(decimals)
+    spin.setRange(lo, hi)
+    spin.setValue(value)
+    spin.setSingleStep(step)
+    if min_width:
+        spin.setMinimumWidth(min_width)
+    return spin
+
+
+def _combo(items: List[str]) -> QComboBox:
+    combo = QComboBox()
+    combo.addItems(items)
+    return combo
 
 
 class SimulateTrackingWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._get_port: Optional[Callable[[], int]] = None
+        # time.monotonic() of the first send; flight_time counts minutes from it
+        self._started: Optional[float] = None
+        self._settings = QSettings()
+        # Last-sent values are written together once sends pause, not on every click
+        self._pending_settings: Dict[str, Any] = {}
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(2000)
+        self._settings_timer.timeout.connect(self._flush_settings)
+        # Info label text is coalesced so rapid sends repaint it at most every 100 ms
+        self._pending_info: Optional[str] = None
+        self._info_timer = QTimer(self)
+        self._info_timer.setSingleShot(True)
+        self._info_timer.setInterval(100)
+        self._info_timer.timeout.connect(self._flush_info)
+        # Created on the first send and reused for every packet after that
+        self._sock: Optional[socket.socket] = None
+        # Destination address, rebuilt only when the port getter returns a new port
+        self._addr: Optional[Tuple[str, int]] = None
+        # Direction combos as +1.0/-1.0 multipliers, kept in sync by their index signals
+        self._lat_sign = 1.0
+        self._lon_sign = 1.0
+        self._dist_sign = 1.0
+        self._fuel_sign = -1.0
         self._setup_ui()
 
     def set_port_getter(self, fn: Callable[[], int]):
@@ -67,147 +143,65 @@ class SimulateTrackingWidget(QWidget):
         group = QGroupBox("Simulate tracking")
         layout = QVBoxLayout()
 
-        row1 = QHBoxLayout()
-        row1.addWidget(QLabel("Status:"))
         self.status_combo = QComboBox()
         self._populate_statuses()
-        row1.addWidget(self.status_combo)
-        row1.addSpacing(12)
-        row1.addWidget(QLabel("Speed (kts):"))
-        self.speed_spin = QSpinBox()
-        self.speed_spin.setRange(0, 2000)
-        self.speed_spin.setValue(250)
-        self.speed_spin.setSingleStep(10)
-        row1.addWidget(self.speed_spin)
-        row1.addSpacing(12)
-        row1.addWidget(QLabel("Alt MSL (ft):"))
-        self.alt_msl_spin = QSpinBox()
-        self.alt_msl_spin.setRange(0, 60000)
-        self.alt_msl_spin.setValue(10000)
-        self.alt_msl_spin.setSingleStep(500)
-        row1.addWidget(self.alt_msl_spin)
-        row1.addSpacing(12)
-        row1.addWidget(QLabel("Alt AGL (ft):"))
-        self.alt_agl_spin = QSpinBox()
-        self.alt_agl_spin.setRange(0, 60000)
-        self.alt_agl_spin.setValue(10000)
-        self.alt_agl_spin.setSingleStep(500)
-        row1.addWidget(self.alt_agl_spin)
-        row1.addSpacing(12)
-        row1.addWidget(QLabel("IAS (kts):"))
-        self.ias_spin = QSpinBox()
-        self.ias_spin.setRange(0, 2000)
-        self.ias_spin.setValue(250)
-        self.ias_spin.setSingleStep(10)
-        row1.addWidget(self.ias_spin)
-        row1.addSpacing(12)
-        row1.addWidget(QLabel("VS (fpm):"))
-        self.vs_spin = QSpinBox()
-        self.vs_spin.setRange(-10000, 10000)
-        self.vs_spin.setValue(0)
-        self.vs_spin.setSingleStep(100)
-        row1.addWidget(self.vs_spin)
-        row1.addStretch()
-        layout.addLayout(row1)
-
-        row2 = QHBoxLayout()
-        row2.addWidget(QLabel("Base Lat:"))
-        self.base_lat = QDoubleSpinBox()
-        self.base_lat.setDecimals(6)
-        self.base_lat.setRange(-90.0, 90.0)
-        self.base_lat.setValue(0.0)
-        self.base_lat.setSingleStep(0.1)
-        self.base_lat.setMinimumWidth(120)
-        row2.addWidget(self.base_lat)
-        row2.addSpacing(12)
-        row2.addWidget(QLabel("Base Lon:"))
-        self.base_lon = QDoubleSpinBox()
-        self.base_lon.setDecimals(6)
-        self.base_lon.setRange(-180.0, 180.0)
-        self.base_lon.setValue(0.0)
-        self.base_lon.setSingleStep(0.1)
-        self.base_lon.setMinimumWidth(120)
-        row2.addWidget(self.base_lon)
-        row2.addStretch()
-        layout.addLayout(row2)
-
-        row3 = QHBoxLayout()
-        row3.addWidget(QLabel("Lat offset:"))
-        self.lat_minutes = QSpinBox()
-        self.lat_minutes.setRange(0, 10000)
-        self.lat_minutes.setValue(1)
-        row3.addWidget(self.lat_minutes)
-        self.lat_dir = QComboBox()
-        self.lat_dir.addItems(["N", "S"])  # N positive, S negative
-        row3.addWidget(self.lat_dir)
-        row3.addSpacing(16)
-        row3.addWidget(QLabel("Lon offset:"))
-        self.lon_minutes = QSpinBox()
-        self.lon_minutes.setRange(0, 10000)
-        self.lon_minutes.setValue(1)
-        row3.addWidget(self.lon_minutes)
-        self.lon_dir = QComboBox()
-        self.lon_dir.addItems(["E", "W"])  # E positive, W negative
-        row3.addWidget(self.lon_dir)
-        row3.addStretch()
-        layout.addLayout(row3)
-
-        # Row for Distance (nm) and Fuel (kg) bases
-        row3b = QHBoxLayout()
-        row3b.addWidget(QLabel("Base Dist (nm):"))
-        self.base_dist = QDoubleSpinBox()
-        self.base_dist.setDecimals(1)
-        self.base_dist.setRange(0.0, 100000.0)
-        self.base_dist.setValue(500.0)
-        self.base_dist.setSingleStep(5.0)
-        self.base_dist.setMinimumWidth(110)
-        row3b.addWidget(self.base_dist)
-        row3b.addSpacing(16)
-        row3b.addWidget(QLabel("Base Fuel (kg):"))
-        self.base_fuel = QDoubleSpinBox()
-        self.base_fuel.setDecimals(1)
-        self.base_fuel.setRange(0.0, 200000.0)
-        self.base_fuel.setValue(5000.0)
-        self.base_fuel.setSingleStep(100.0)
-        self.base_fuel.setMinimumWidth(110)
-        row3b.addWidget(self.base_fuel)
-        row3b.addStretch()
-        layout.addLayout(row3b)
-
-        # Row for Dist/Fuel offsets (similar to lat/lon)
-        row3c = QHBoxLayout()
-        row3c.addWidget(QLabel("Dist change:"))
-        self.dist_delta = QDoubleSpinBox()
-        self.dist_delta.setDecimals(1)
-        self.dist_delta.setRange(0.0, 100000.0)
-        self.dist_delta.setValue(5.0)
-        self.dist_delta.setSingleStep(1.0)
-        row3c.addWidget(self.dist_delta)
-        self.dist_dir = QComboBox()
-        self.dist_dir.addItems(["+", "-"])  # default increase remaining distance
-        row3c.addWidget(self.dist_dir)
-        row3c.addSpacing(16)
-        row3c.addWidget(QLabel("Fuel change:"))
-        self.fuel_delta = QDoubleSpinBox()
-        self.fuel_delta.setDecimals(1)
-        self.fuel_delta.setRange(0.0, 200000.0)
-        self.fuel_delta.setValue(100.0)
-        self.fuel_delta.setSingleStep(10.0)
-        row3c.addWidget(self.fuel_delta)
-        self.fuel_dir = QComboBox()
-        self.fuel_dir.addItems(["-", "+"])  # default decrease remaining fuel
-        row3c.addWidget(self.fuel_dir)
-        row3c.addStretch()
-        layout.addLayout(row3c)
-
-        last_sent_lat = QSettings().value("bridge_status_widget/last_sent_lat")
-        last_sent_lon = QSettings().value("bridge_status_widget/last_sent_lon")
+        self.speed_spin = _spin(0, 2000, 250, 10)
+        self.alt_msl_spin = _spin(0, 60000, 10000, 500)
+        self.alt_agl_spin = _spin(0, 60000, 10000, 500)
+        self.ias_spin = _spin(0, 2000, 250, 10)
+        self.vs_spin = _spin(-10000, 10000, 0, 100)
+        self.base_lat = _double_spin(-90.0, 90.0, 0.0, 0.1, 6, 120)
+        self.base_lon = _double_spin(-180.0, 180.0, 0.0, 0.1, 6, 120)
+        self.lat_minutes = _spin(0, 10000, 1)
+        self.lat_dir = _combo(["N", "S"])  # N positive, S negative
+        self.lon_minutes = _spin(0, 10000, 1)
+        self.lon_dir = _combo(["E", "W"])  # E positive, W negative
+        self.base_dist = _double_spin(0.0, 100000.0, 500.0, 5.0, 1, 110)
+        self.base_fuel = _double_spin(0.0, 200000.0, 5000.0, 100.0, 1, 110)
+        self.dist_delta = _double_spin(0.0, 100000.0, 5.0, 1.0, 1)
+        self.dist_dir = _combo(["+", "-"])  # default increase remaining distance
+        self.fuel_delta = _double_spin(0.0, 200000.0, 100.0, 10.0, 1)
+        self.fuel_dir = _combo(["-", "+"])  # default decrease remaining fuel
+
+        self.lat_dir.currentIndexChanged.connect(lambda i: setattr(self, "_lat_sign", 1.0 if i == 0 else -1.0))
+        self.lon_dir.currentIndexChanged.connect(lambda i: setattr(self, "_lon_sign", 1.0 if i == 0 else -1.0))
+        self.dist_dir.currentIndexChanged.connect(lambda i: setattr(self, "_dist_sign", 1.0 if i == 0 else -1.0))
+        self.fuel_dir.currentIndexChanged.connect(lambda i: setattr(self, "_fuel_sign", -1.0 if i == 0 else 1.0))
+
+        # (label, widget, ...) cells per grid row; a cell with several widgets shares one column
+        rows = (
+            (("Status:", self.status_combo), ("Speed (kts):", self.speed_spin),
+             ("Alt MSL (ft):", self.alt_msl_spin), ("Alt AGL (ft):", self.alt_agl_spin),
+             ("IAS (kts):", self.ias_spin), ("VS (fpm):", self.vs_spin)),
+            (("Base Lat:", self.base_lat), ("Base Lon:", self.base_lon)),
+            (("Lat offset:", self.lat_minutes, self.lat_dir), ("Lon offset:", self.lon_minutes, self.lon_dir)),
+            (("Base Dist (nm):", self.base_dist), ("Base Fuel (kg):", self.base_fuel)),
+            (("Dist change:", self.dist_delta, self.dist_dir), ("Fuel change:", self.fuel_delta, self.fuel_dir)),
+        )
+        grid = QGridLayout()
+        columns = 0
+        for r, cells in enumerate(rows):
+            for c, (label, *widgets) in enumerate(cells):
+                grid.addWidget(QLabel(label), r, 2 * c)
+                if len(widgets) == 1:
+                    grid.addWidget(widgets[0], r, 2 * c + 1)
+                else:
+                    box = QHBoxLayout()
+                    for w in widgets:
+                        box.addWidget(w)
+                    grid.addLayout(box, r, 2 * c + 1)
+            columns = max(columns, 2 * len(cells))
+        grid.setColumnStretch(columns, 1)
+        layout.addLayout(grid)
+
+        last_sent_lat = self._settings.value("bridge_status_widget/last_sent_lat")
+        last_sent_lon = self._settings.value("bridge_status_widget/last_sent_lon")
         if last_sent_lat is not None and last_sent_lon is not None:
             self.base_lat.setValue(float(last_sent_lat))
             self.base_lon.setValue(float(last_sent_lon))
         # Restore last dist/fuel if available
-        last_dist = QSettings().value("bridge_status_widget/last_sent_dist")
-        last_fuel = QSettings().value("bridge_status_widget/last_sent_fuel")
+        last_dist = self._settings.value("bridge_status_widget/last_sent_dist")
+        last_fuel = self._settings.value("bridge_status_widget/last_sent_fuel")
         try:
             if last_dist is not None:
                 self.base_dist.setValue(float(last_dist))
@@ -222,6 +216,11 @@ class SimulateTrackingWidget(QWidget):
         self.info_label = QLabel("")
         self.info_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         row4.addWidget(self.send_btn)
+        row4.addSpacing(8)
+        row4.addWidget(QLabel("Burst:"))
+        self.burst_spin = _spin(1, 1000, 1)
+        self.burst_spin.setToolTip("Number of consecutive steps to send per click")
+        row4.addWidget(self.burst_spin)
         row4.addSpacing(12)
         row4.addWidget(self.info_label)
         row4.addStretch()
@@ -231,33 +230,43 @@ class SimulateTrackingWidget(QWidget):
         outer_layout.addWidget(group)
         self.setLayout(outer_layout)
 
+    def _set_info(self, text: str):
+        """Show text in the info label; only the latest within a short window is painted."""
+        self._pending_info = text
+        if not self._info_timer.isActive():
+            self._info_timer.start()
+
+    def _flush_info(self):
+        if self._pending_info is not None:
+            self.info_label.setText(self._pending_info)
+            self._pending_info = None
+
+    def _flush_settings(self):
+        if not self._pending_settings:
+            return
+        for key, value in self._pending_settings.items():
+            self._settings.setValue(key, value)
+        self._pending_settings.clear()
+        self._settings.sync()
+
+    def closeEvent(self, event):
+        self._settings_timer.stop()
+        self._flush_settings()
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except Exception:
+                pass
+            self._sock = None
+        super().closeEvent(event)
+
     def _populate_statuses(self):
-        # Populate from enum values
-        try:
-            # Preserve the order as defined
-            items = []
-            for name in dir(_PirepStatus):
-                if name.startswith("_"):
-                    continue
-                member = getattr(_PirepStatus, name)
-                try:
-                    code = member.value
-                except Exception:
-                    continue
-                if isinstance(code, str):
-                    items.append((name, code))
-            # Prefer a stable order; sort by code for consistency
-            items = sorted(items, key=lambda x: x[1])
-            for name, code in items:
-                self.status_combo.addItem(f"{name} ({code})", code)
-            # Default to INI if present
-            idx = self.status_combo.findData("INI")
-            if idx >= 0:
-                self.status_combo.setCurrentIndex(idx)
-        except Exception:
-            # Fallback minimal set
-            for code in ["INI", "BST", "TXI", "TOF", "ENR", "ARR", "PSD"]:
-                self.status_combo.addItem(code, code)
+        for name, code in _STATUS_ITEMS:
+            self.status_combo.addItem(f"{name} ({code})", code)
+        # Default to INI if present
+        idx = self.status_combo.findData("INI")
+        if idx >= 0:
+            self.status_combo.setCurrentIndex(idx)
 
     def _dest_port(self) -> int:
         try:
@@ -270,80 +279,77 @@ class SimulateTrackingWidget(QWidget):
         return 47777
 
     def _on_send(self):
-        # Compute new position by applying minute offsets to the base
-        lat = float(self.base_lat.value())
-        lon = float(self.base_lon.value())
-        dlat = (self.lat_minutes.value() or 0) / 60.0
-        dlon = (self.lon_minutes.value() or 0) / 60.0
-        if self.lat_dir.currentText() == "S":
-            dlat = -dlat
-        if self.lon_dir.currentText() == "W":
-            dlon = -dlon
-        new_lat = max(-90.0, min(90.0, lat + dlat))
-        new_lon = lon + dlon
-        while new_lon > 180.0:
-            new_lon -= 360.0
-        while new_lon < -180.0:
-            new_lon += 360.0
+        # Step from the base by the configured offsets, once per packet in the burst
+        new_lat = self.base_lat.value()
+        new_lon = self.base_lon.value()
+        new_dist = self.base_dist.value()
+        new_fuel = self.base_fuel.value()
+        dlat = self.lat_minutes.value() * self._lat_sign / 60.0
+        dlon = self.lon_minutes.value() * self._lon_sign / 60.0
+        ddist = self.dist_delta.value() * self._dist_sign
+        dfuel = self.fuel_delta.value() * self._fuel_sign
 
         status = self.status_combo.currentData() or "INI"
-        gs = int(self.speed_spin.value())
-        alt_msl = int(self.alt_msl_spin.value())
-        alt_agl = int(self.alt_agl_spin.value())
-        ias = int(self.ias_spin.value())
-        vs = int(self.vs_spin.value())
-
-        # Compute new dist/fuel using base +/- delta
-        cur_dist = float(self.base_dist.value())
-        cur_fuel = float(self.base_fuel.value())
-        ddist = float(self.dist_delta.value())
-        dfuel = float(self.fuel_delta.value())
-        if self.dist_dir.currentText() == "-":
-            new_dist = max(0.0, cur_dist - ddist)
-        else:
-            new_dist = cur_dist + ddist
-        if self.fuel_dir.currentText() == "-":
-            new_fuel = max(0.0, cur_fuel - dfuel)
-        else:
-            new_fuel = cur_fuel + dfuel
-
-        payload = {
-            "status": status,
-            "position": {
-                "lat": round(new_lat, 6),
-                "lon": round(new_lon, 6),
-                "altitude_msl": alt_msl,
-                "altitude_agl": alt_agl,
-                "gs": gs,
-                "sim_time": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-                "distance": round(new_dist, 1),
-                "ias": ias,
-                "vs": vs,
-            },
-            # As per bridge expectations and docs, send these names:
-            "fuel": round(new_fuel, 1),    # kilograms remaining
-        }
-
-        host = "127.0.0.1"
+        gs = self.speed_spin.value()
+        alt_msl = self.alt_msl_spin.value()
+        alt_agl = self.alt_agl_spin.value()
+        ias = self.ias_spin.value()
+        vs = self.vs_spin.value()
+        now = time.monotonic()
+        if self._started is None:
+            self._started = now
+        flight_time = int((now - self._started) // 60)
+
+        # (packet bytes, lat, lon, dist, fuel) per step
+        steps = []
+        # Bind the per-step helpers once; each widget value above is read once per click
+        append, compute, stamp, tmpl = steps.append, _compute_step, _utc_timestamp, _PACKET_TEMPLATE
+        for _ in range(self.burst_spin.value()):
+            new_lat, new_lon, new_dist, new_fuel = compute(
+                new_lat, new_lon, new_dist, new_fuel, dlat, dlon, ddist, dfuel)
+            data = (tmpl % (
+                status, new_lat, new_lon, alt_msl, alt_agl, gs, stamp(),
+                new_dist, ias, vs, new_fuel, flight_time,
+            )).encode("ascii")
+            append((data, new_lat, new_lon, new_dist, new_fuel))
+
         port = self._dest_port()
+        if self._addr is None or self._addr[1] != port:
+            self._addr = ("127.0.0.1", port)
+        host = self._addr[0]
         try:
-            data = json.dumps(payload).encode("utf-8")
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            if self._sock is None:
+                self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._sock.setblocking(False)
+                try:
+                    # Room for bursts of sends when Send is clicked repeatedly
+                    self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+                except OSError:
+                    pass
+            sent = 0
+            sendto, addr = self._sock.sendto, self._addr
             try:
-                sock.sendto(data, (host, port))
-            finally:
-                sock.close()
-            self.info_label.setText(
-                f"Sent {status} to {host}:{port} lat={payload['position']['lat']} lon={payload['position']['lon']} dist={payload['position']['distance']}nm fuel={payload['fuel']}kg"
-            )
-            # Update bases to the new values for step-wise repetition
+                for pkt in steps:
+                    sendto(pkt[0], addr)
+                    sent += 1
+            except BlockingIOError:
+                pass
+            if not sent:
+                self._set_info("Send buffer full; packet dropped")
+                return
+            _, new_lat, new_lon, new_dist, new_fuel = steps[sent - 1]
+            count = f" x{sent}" if len(steps) > 1 else ""
+            dropped = f" ({len(steps) - sent} dropped)" if sent < len(steps) else ""
+            self._set_info(_INFO_TEMPLATE % (status, count, host, port, new_lat, new_lon, new_dist, new_fuel, dropped))
+            # Update bases to the last sent values for step-wise repetition
             self.base_lat.setValue(new_lat)
             self.base_lon.setValue(new_lon)
             self.base_dist.setValue(new_dist)
             self.base_fuel.setValue(new_fuel)
-            QSettings().setValue("bridge_status_widget/last_sent_lat", new_lat)
-            QSettings().setValue("bridge_status_widget/last_sent_lon", new_lon)
-            QSettings().setValue("bridge_status_widget/last_sent_dist", new_dist)
-            QSettings().setValue("bridge_status_widget/last_sent_fuel", new_fuel)
+            self._pending_settings["bridge_status_widget/last_sent_lat"] = new_lat
+            self._pending_settings["bridge_status_widget/last_sent_lon"] = new_lon
+            self._pending_settings["bridge_status_widget/last_sent_dist"] = new_dist
+            self._pending_settings["bridge_status_widget/last_sent_fuel"] = new_fuel
+            self._settings_timer.start()
         except Exception as e:
-            self.info_label.setText(f"Error: {e}")
+            self._set_info(f"Error: {e}")
@@ -73,6 +73,17 @@ AXIS_FLIPS = {
     "z": -1.0,  # often Talon +z is forward, while opentrack often expects +z towards user. Flip if needed.
 }
 
+# Derived once from the config above for the per-tick send path
+_ADDR = (HOST, PORT)
+_SX = SCALE_MM_TO_CM * AXIS_FLIPS["x"]
+_SY = SCALE_MM_TO_CM * AXIS_FLIPS["y"]
+_SZ = SCALE_MM_TO_CM * AXIS_FLIPS["z"]
+# Every pose is packed into the same 48-byte buffer and sent from a view of it
+_POSE_STRUCT = struct.Struct("<dddddd")
+_POSE_BUF = bytearray(_POSE_STRUCT.size)
+_POSE_VIEW = memoryview(_POSE_BUF)
+_PACK_POSE_INTO = _POSE_STRUCT.pack_into
+
 # ===================== UDP Sender =====================
 _sock: Optional[socket.socket] = None
 _job = None
@@ -82,6 +93,10 @@ def _udp_open():
     global _sock
     if _sock is None:
         _sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # Connected and non-blocking: each tick is a plain send(), and a full
+        # buffer drops the pose instead of stalling Talon's cron thread
+        _sock.setblocking(False)
+        _sock.connect(_ADDR)
 
 
 def _udp_close():
@@ -229,16 +244,20 @@ def _send_pose_tick():
         y_cm = 0.0
         z_cm = 0.0
     else:
-        x_cm = xyz_mm[0] * SCALE_MM_TO_CM * AXIS_FLIPS["x"]
-        y_cm = xyz_mm[1] * SCALE_MM_TO_CM * AXIS_FLIPS["y"]
-        z_cm = xyz_mm[2] * SCALE_MM_TO_CM * AXIS_FLIPS["z"]
+        # _get_head_position_mm already returns floats
+        x_cm = xyz_mm[0] * _SX
+        y_cm = xyz_mm[1] * _SY
+        z_cm = xyz_mm[2] * _SZ
 
     # yaw/pitch/roll zeroed; positions in cm
-    payload = struct.pack("<dddddd", 0.0, 0.0, 0.0, float(x_cm), float(y_cm), float(z_cm))
+    _PACK_POSE_INTO(_POSE_BUF, 0, 0.0, 0.0, 0.0, x_cm, y_cm, z_cm)
     try:
-        _sock.sendto(payload, (HOST, PORT))
+        _sock.send(_POSE_VIEW)
+    except BlockingIOError:
+        # opentrack tolerates loss; the next tick carries a fresh pose
+        pass
     except Exception:
-        # swallow transient UDP/network errors
+        # swallow transient UDP/network errors (e.g. refused while opentrack is not listening)
         pass
 
 
@@ -1,9 +1,25 @@
-import json
+import selectors
 import socket
 import threading
 import time
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+from collections import deque
+from typing import Deque, Dict, Any, Optional, List, Union
+
+# Packets are parsed straight from bytes; orjson when available, stdlib json otherwise
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    import json
+
+    def _json_loads(data) -> Any:
+        # stdlib json does not take memoryviews
+        return json.loads(bytes(data))
+
+
+def _iso_from_epoch(t: float) -> str:
+    """Format epoch seconds as 'YYYY-MM-DDTHH:MM:SSZ' (UTC)."""
+    g = time.gmtime(t)
+    return "%04d-%02d-%02dT%02d:%02d:%02dZ" % (g.tm_year, g.tm_mon, g.tm_mday, g.tm_hour, g.tm_min, g.tm_sec)
 
 
 class UdpBridge:
@@ -37,6 +53,8 @@ class UdpBridge:
         self._thread: Optional[threading.Thread] = None
         self._stop_evt = threading.Event()
         self._lock = threading.Lock()
+        # Write end of the receive loop's wakeup socket pair; stop() pokes it
+        self._wake_w: Optional[socket.socket] = None
 
         # Metrics/state for UI
         self._running: bool = False
@@ -49,8 +67,14 @@ class UdpBridge:
         self._last_dist: Optional[float] = None
         self._last_fuel: Optional[float] = None
         self._last_flight_time: Optional[float] = None
-        self._log: List[str] = []  # rolling log strings
         self._max_log_lines: int = 500
+        self._log: Deque[str] = deque(maxlen=self._max_log_lines)  # rolling log strings
+        self._log_total: int = 0  # lines ever appended; lets readers tell which lines are new
+        # Log timestamp text, re-formatted only when the wall-clock second changes
+        self._log_ts_sec: int = -1
+        self._log_ts_str: str = ""
+        # Raw bytes of the last fully handled packet; an exact repeat is only counted
+        self._last_data: bytes = b""
 
     # ----------------------- Public control -----------------------
     def start(self) -> None:
@@ -62,6 +86,12 @@ class UdpBridge:
 
     def stop(self) -> None:
         self._stop_evt.set()
+        wake_w = self._wake_w
+        if wake_w is not None:
+            try:
+                wake_w.send(b"\0")
+            except OSError:
+                pass
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
         with self._lock:
@@ -95,6 +125,7 @@ class UdpBridge:
                 "last_fuel": self._last_fuel,
                 "last_flight_time": self._last_flight_time,
                 "log": list(self._log),
+                "log_total": self._log_total,
             }
 
     # ----------------------- Internal loop -----------------------
@@ -102,10 +133,17 @@ class UdpBridge:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
             sock.bind((self.host, self.port))
-            sock.settimeout(0.5)
+            # Non-blocking: the selector waits for data, then each wakeup drains a batch
+            sock.setblocking(False)
+            # Room to absorb bursts while a packet is being handled; the kernel may cap this
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+            except OSError:
+                pass
+            rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
             with self._lock:
                 self._running = True
-                self._append_log(f"UDP bridge listening on {self.host}:{self.port}")
+                self._append_log(f"UDP bridge listening on {self.host}:{self.port} (rcvbuf {rcvbuf // 1024} KiB)")
         except Exception as e:
             with self._lock:
                 self._last_error = f"Bind failed: {e}"
@@ -114,103 +152,166 @@ class UdpBridge:
             sock.close()
             return
 
-        while not self._stop_evt.is_set():
+        # Block until a packet arrives or stop() writes to the wakeup pair; no idle polling
+        wake_r, self._wake_w = socket.socketpair()
+        sel = selectors.DefaultSelector()
+        sel.register(sock, selectors.EVENT_READ)
+        sel.register(wake_r, selectors.EVENT_READ)
+        # One receive buffer reused for every datagram; packets are handled as views into it
+        view = memoryview(bytearray(64 * 1024))
+        # Loop-invariant lookups bound once
+        stop_is_set = self._stop_evt.is_set
+        select = sel.select
+        drain = self._drain
+        record_error = self._record_loop_error
+        while not stop_is_set():
             try:
-                try:
-                    data, _ = sock.recvfrom(64 * 1024)
-                except socket.timeout:
-                    continue
-                self._handle_packet(data)
+                if any(key.fileobj is sock for key, _ in select()):
+                    drain(sock, view)
             except Exception as e:
-                with self._lock:
-                    self._packets_err += 1
-                    self._last_error = str(e)
-                    self._append_log(f"ERR: {e}")
+                record_error(e)
         try:
+            sel.close()
+            wake_r.close()
+            self._wake_w.close()
+            self._wake_w = None
             sock.close()
         finally:
             with self._lock:
                 self._running = False
                 self._append_log("UDP bridge stopped")
 
-    def _handle_packet(self, data: bytes) -> None:
+    def _drain(self, sock: socket.socket, view: memoryview, max_msgs: int = 32) -> None:
+        """Receive and handle up to max_msgs queued datagrams from a non-blocking socket."""
+        recv_into = sock.recv_into
+        handle = self._handle_packet
+        for _ in range(max_msgs):
+            try:
+                n = recv_into(view)
+            except BlockingIOError:
+                return
+            try:
+                handle(view[:n])
+            except Exception as e:
+                self._record_loop_error(e)
+
+    def _record_loop_error(self, e: Exception) -> None:
+        with self._lock:
+            self._packets_err += 1
+            self._last_error = str(e)
+            self._append_log(f"ERR: {e}")
+
+    def _handle_packet(self, data: Union[bytes, memoryview]) -> None:
+        """Handle one datagram. data may be a view into the reused receive buffer,
+        so nothing here may keep a reference to it."""
         now = time.time()
+        if data == self._last_data:
+            # Byte-identical resend (same sim_time too): nothing new to parse or dispatch
+            with self._lock:
+                self._packets_ok += 1
+                self._last_packet_time = now
+            return
         try:
-            payload = json.loads(data.decode("utf-8"))
+            payload = _json_loads(data)
         except Exception as e:
-            with self._lock:
-                self._packets_err += 1
-                self._last_error = f"JSON decode error: {e}"
-                self._append_log(self._last_error)
+            self._reject(f"JSON decode error: {e}")
             return
 
-        payload["flight_time"] = int(payload["flight_time"])
-        payload["position"]["sim_time"] = datetime.fromtimestamp(float(payload["position"]["sim_time"])).strftime("%Y-%m-%dT%H:%M:%SZ")
-        status = payload.get("status")
-        if isinstance(status, str) and status:
-            with self._lock:
-                self._last_status = status
+        # Shape checks up front, before anything in the payload is touched
+        if not isinstance(payload, dict):
+            self._reject("Packet is not a JSON object")
+            return
+        get = payload.get
+        ft = get("flight_time")
+        if not isinstance(ft, (int, float)) or isinstance(ft, bool):
+            self._reject("Packet has no numeric flight_time")
+            return
+        pos = get("position")
+        if not isinstance(pos, dict):
+            self._reject("Packet has no position object")
+            return
+        sim_time = pos.get("sim_time")
+        if isinstance(sim_time, (int, float)) and not isinstance(sim_time, bool):
+            pos["sim_time"] = _iso_from_epoch(float(sim_time))
+        elif not isinstance(sim_time, str):
+            # The FlyWithLua script already sends an ISO-8601 string; anything else is malformed
+            self._reject("Packet has no position.sim_time")
+            return
+
+        # Read every field once into locals; the new UI mirror state is published under one lock below
         # Root-level flight_time (minutes or seconds as provided by Lua)
-        ft_val = payload.get("flight_time")
-        if isinstance(ft_val, (int, float)):
-            with self._lock:
-                self._last_flight_time = float(ft_val)
-        pos = payload.get("position") or {}
-        if isinstance(pos, dict):
-            with self._lock:
-                self._last_position = {k: pos.get(k) for k in ("lat", "lon", "altitude_msl", "altitude_agl", "heading", "gs", "sim_time", "distance", "ias", "vs")}
-        try:
-            dist_val = pos.get("distance")
-            fuel_val = payload.get("fuel")
-            with self._lock:
-                if isinstance(dist_val, (int, float)):
-                    self._last_dist = float(dist_val)
-                if isinstance(fuel_val, (int, float)):
-                    self._last_fuel = float(fuel_val)
-        except Exception:
-            pass
+        flight_time = float(int(ft))
+        status = get("status")
+        fuel_val = get("fuel")
+        events = get("events")
+        pos_get = pos.get
+        dist_val = pos_get("distance")
+        # Type checks done once here; everything below reuses the results
+        status_ok = isinstance(status, str) and bool(status)
+        events_ok = isinstance(events, list) and bool(events)
+        new_status = status if status_ok else None
+        new_pos = {
+            "lat": pos_get("lat"), "lon": pos_get("lon"),
+            "altitude_msl": pos_get("altitude_msl"), "altitude_agl": pos_get("altitude_agl"),
+            "heading": pos_get("heading"), "gs": pos_get("gs"), "sim_time": pos["sim_time"],
+            "distance": dist_val, "ias": pos_get("ias"), "vs": pos_get("vs"),
+        }
+        new_dist = float(dist_val) if isinstance(dist_val, (int, float)) else None
+        new_fuel = float(fuel_val) if isinstance(fuel_val, (int, float)) else None
 
-        try:
-            if isinstance(status, str) and status and callable(self._status_handler):
-                self._status_handler(status, pos.get("distance"), payload.get("fuel"), self._last_flight_time)
-        except Exception as e:
-            with self._lock:
-                self._packets_err += 1
-                self._last_error = f"status_handler: {e}"
-                self._append_log(self._last_error)
-        try:
-            if isinstance(pos, dict) and callable(self._position_handler):
-                self._position_handler(pos)
-        except Exception as e:
-            with self._lock:
-                self._packets_err += 1
-                self._last_error = f"position_handler: {e}"
-                self._append_log(self._last_error)
-        try:
-            events = payload.get("events")
-            if isinstance(events, list) and events and callable(self._events_handler):
-                self._events_handler(events)
-        except Exception as e:
-            with self._lock:
-                self._packets_err += 1
-                self._last_error = f"events_handler: {e}"
-                self._append_log(self._last_error)
+        # Handlers run outside the lock since they may do I/O; a failing one doesn't stop the rest
+        calls = [("position_handler", self._position_handler, (pos,))]
+        if status_ok:
+            calls.insert(0, ("status_handler", self._status_handler, (new_status, dist_val, fuel_val, flight_time)))
+        if events_ok:
+            calls.append(("events_handler", self._events_handler, (events,)))
+        errors: List[str] = []
+        for name, fn, args in calls:
+            if callable(fn):
+                try:
+                    fn(*args)
+                except Exception as e:
+                    errors.append(f"{name}: {e}")
 
-        # Success accounting
         with self._lock:
+            if status_ok:
+                self._last_status = new_status
+            self._last_flight_time = flight_time
+            self._last_position = new_pos
+            if new_dist is not None:
+                self._last_dist = new_dist
+            if new_fuel is not None:
+                self._last_fuel = new_fuel
+            for msg in errors:
+                self._packets_err += 1
+                self._last_error = msg
+                self._append_log(msg)
+            # Success accounting. Only a fully handled packet may short-circuit an identical
+            # resend; after a handler failure the sender's retry must reach the handlers again.
+            self._last_data = b"" if errors else bytes(data)
             self._packets_ok += 1
             self._last_packet_time = now
-            s = status or "-"
-            p = self._last_position or {}
+            s = new_status or "-"
+            p = new_pos
             self._append_log(
                 f"OK: st={s} lat={p.get('lat')} lon={p.get('lon')} alt_msl={p.get('altitude_msl')} alt_agl={p.get('altitude_agl')} gs={p.get('gs')} dist={self._last_dist}nm fuel={self._last_fuel}kg ft={self._last_flight_time}"
             )
 
+    def _reject(self, msg: str) -> None:
+        """Count a packet that could not be used and log why."""
+        with self._lock:
+            self._packets_err += 1
+            self._last_error = msg
+            self._append_log(msg)
 
     def _append_log(self, line: str) -> None:
-        ts = time.strftime("%H:%M:%S", time.localtime())
-        entry = f"[{ts}] {line}"
+        # Called with self._lock held
+        now = time.time()
+        sec = int(now)
+        if sec != self._log_ts_sec:
+            self._log_ts_sec = sec
+            self._log_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        entry = f"[{self._log_ts_str}] {line}"
+        # deque(maxlen) drops the oldest line once full
         self._log.append(entry)
-        if len(self._log) > self._max_log_lines:
-            # keep last N lines
-            self._log = self._log[-self._max_log_lines:]
+        self._log_total += 1
@@ -1,201 +1,263 @@
-from typing import TypedDict, Optional, List, Any, Dict
+from __future__ import annotations
+
+from typing import TypedDict, Any, get_args, get_type_hints
 
 # Core resource types to consume phpVMS API responses
 
 class Flight(TypedDict, total=False):
     """Type definition for Flight resource (matches API fields)"""
-    id: Optional[int]
-    airline_id: Optional[int]
-    flight_number: Optional[str]
-    route_code: Optional[str]
-    route_leg: Optional[int]
-    dpt_airport_id: Optional[str]
-    arr_airport_id: Optional[str]
-    alt_airport_id: Optional[str]
-    dpt_time: Optional[str]
-    arr_time: Optional[str]
-    flight_time: Optional[int]  # minutes
-    flight_type: Optional[int]
-    distance: Optional[float]  # nautical miles
-    level: Optional[int]
-    route: Optional[str]
-    notes: Optional[str]
-    active: Optional[bool]
-    visible: Optional[bool]
-    created_at: Optional[str]
-    updated_at: Optional[str]
+    id: int | None
+    airline_id: int | None
+    flight_number: str | None
+    route_code: str | None
+    route_leg: int | None
+    dpt_airport_id: str | None
+    arr_airport_id: str | None
+    alt_airport_id: str | None
+    dpt_time: str | None
+    arr_time: str | None
+    flight_time: int | None  # minutes
+    flight_type: int | None
+    distance: float | None  # nautical miles
+    level: int | None
+    route: str | None
+    notes: str | None
+    active: bool | None
+    visible: bool | None
+    created_at: str | None
+    updated_at: str | None
 
 class Fare(TypedDict, total=False):
     """Type definition for Fare resource (kept generic)"""
-    id: Optional[int]
-    name: Optional[str]
-    price: Optional[float]
-    cost: Optional[float]
+    id: int | None
+    name: str | None
+    price: float | None
+    cost: float | None
 
 class Aircraft(TypedDict, total=False):
     """Type definition for Aircraft resource (basic fields)"""
-    id: Optional[int]
-    subfleet_id: Optional[int]
-    airport_id: Optional[str]
-    iata: Optional[str]
-    icao: Optional[str]
-    name: Optional[str]
-    registration: Optional[str]
-    hex_code: Optional[str]
-    zfw: Optional[float]
-    mtow: Optional[float]
-    state: Optional[int]
-    status: Optional[int]
-    created_at: Optional[str]
-    updated_at: Optional[str]
+    id: int | None
+    subfleet_id: int | None
+    airport_id: str | None
+    iata: str | None
+    icao: str | None
+    name: str | None
+    registration: str | None
+    hex_code: str | None
+    zfw: float | None
+    mtow: float | None
+    state: int | None
+    status: int | None
+    created_at: str | None
+    updated_at: str | None
 
 # Core resource types based on PHP resources
 
 class Airline(TypedDict, total=False):
     """Type definition for Airline resource"""
-    id: Optional[int]
-    icao: Optional[str]
-    iata: Optional[str]
-    name: Optional[str]
-    country: Optional[str]
-    logo: Optional[str]
-    active: Optional[bool]
-    created_at: Optional[str]
-    updated_at: Optional[str]
+    id: int | None
+    icao: str | None
+    iata: str | None
+    name: str | None
+    country: str | None
+    logo: str | None
+    active: bool | None
+    created_at: str | None
+    updated_at: str | None
 
 class UserBid(TypedDict, total=False):
     """Type definition for UserBid resource"""
-    id: Optional[int]
-    user_id: Optional[int]
-    flight_id: Optional[int]
-    aircraft_id: Optional[int]
-    created_at: Optional[str]  # ISO datetime string
-    updated_at: Optional[str]  # ISO datetime string
-    flight: Optional[Flight]
+    id: int | None
+    user_id: int | None
+    flight_id: int | None
+    aircraft_id: int | None
+    created_at: str | None  # ISO datetime string
+    updated_at: str | None  # ISO datetime string
+    flight: Flight | None
 
 class Subfleet(TypedDict, total=False):
     """Type definition for Subfleet resource"""
-    id: Optional[int]
-    name: Optional[str]
-    type: Optional[str]
-    fares: Optional[List[Fare]]
-    aircraft: Optional[List[Aircraft]]
+    id: int | None
+    name: str | None
+    type: str | None
+    fares: list[Fare] | None
+    aircraft: list[Aircraft] | None
 
 class Rank(TypedDict, total=False):
     """Type definition for Rank resource"""
-    name: Optional[str]
-    subfleets: Optional[List[Subfleet]]
+    name: str | None
+    subfleets: list[Subfleet] | None
 
 class User(TypedDict, total=False):
     """Type definition for User resource (matches API fields)"""
-    id: Optional[int]
-    pilot_id: Optional[str]
-    ident: Optional[str]
-    name: Optional[str]
-    name_private: Optional[str]
-    email: Optional[str]
-    avatar: Optional[str]
-    discord_id: Optional[str]
-    vatsim_id: Optional[str]
-    ivao_id: Optional[str]
-    airline_id: Optional[int]
-    rank_id: Optional[int]
-    home_airport_id: Optional[str]
-    curr_airport_id: Optional[str]
-    last_pirep_id: Optional[int]
-    flights: Optional[int]
-    flight_time: Optional[int]
-    transfer_time: Optional[int]
-    total_time: Optional[int]
-    balance: Optional[float]
-    timezone: Optional[str]
-    state: Optional[int]
-    status: Optional[int]
-    created_at: Optional[str]
-    updated_at: Optional[str]
+    id: int | None
+    pilot_id: str | None
+    ident: str | None
+    name: str | None
+    name_private: str | None
+    email: str | None
+    avatar: str | None
+    discord_id: str | None
+    vatsim_id: str | None
+    ivao_id: str | None
+    airline_id: int | None
+    rank_id: int | None
+    home_airport_id: str | None
+    curr_airport_id: str | None
+    last_pirep_id: int | None
+    flights: int | None
+    flight_time: int | None
+    transfer_time: int | None
+    total_time: int | None
+    balance: float | None
+    timezone: str | None
+    state: int | None
+    status: int | None
+    created_at: str | None
+    updated_at: str | None
     # Nested resources
-    airline: Optional[Airline]
-    bids: Optional[List[UserBid]]
-    rank: Optional[Rank]
-    subfleets: Optional[List[Subfleet]]
+    airline: Airline | None
+    bids: list[UserBid] | None
+    rank: Rank | None
+    subfleets: list[Subfleet] | None
+
+class Comment(TypedDict, total=False):
+    """Type definition for PIREP Comment resource"""
+    id: int | None
+    pirep_id: int | None
+    user_id: int | None
+    comment: str | None
+    created_at: str | None
+    updated_at: str | None
+    user: User | None
 
 class Pirep(TypedDict, total=False):
     """Type definition for PIREP resource (matches API fields)"""
-    id: Optional[int]
-    user_id: Optional[int]
-    airline_id: Optional[int]
-    aircraft_id: Optional[int]
-    flight_id: Optional[int]
-    flight_number: Optional[str]
-    route_code: Optional[str]
-    route_leg: Optional[int]
-    dpt_airport_id: Optional[str]
-    arr_airport_id: Optional[str]
-    level: Optional[int]
-    distance: Optional[float]  # Ensure numeric
-    planned_distance: Optional[float]
-    flight_time: Optional[int]  # minutes
-    planned_flight_time: Optional[int]
-    zfw: Optional[float]
-    block_fuel: Optional[float]
-    fuel_used: Optional[float]
-    landing_rate: Optional[float]
-    score: Optional[int]
-    source: Optional[int]
-    state: Optional[int]
-    status: Optional[int]
-    route: Optional[str]
-    notes: Optional[str]
-    created_at: Optional[str]
-    updated_at: Optional[str]
-    submitted_at: Optional[str]
+    id: int | None
+    user_id: int | None
+    airline_id: int | None
+    aircraft_id: int | None
+    flight_id: int | None
+    flight_number: str | None
+    route_code: str | None
+    route_leg: int | None
+    dpt_airport_id: str | None
+    arr_airport_id: str | None
+    level: int | None
+    distance: float | None  # Ensure numeric
+    planned_distance: float | None
+    flight_time: int | None  # minutes
+    planned_flight_time: int | None
+    zfw: float | None
+    block_fuel: float | None
+    fuel_used: float | None
+    landing_rate: float | None
+    score: int | None
+    source: int | None
+    state: int | None
+    status: int | None
+    route: str | None
+    notes: str | None
+    created_at: str | None
+    updated_at: str | None
+    submitted_at: str | None
     # Common nested resources returned by API
-    user: Optional[User]
-    airline: Optional[Airline]
-    aircraft: Optional[Aircraft]
-    flight: Optional[Flight]
-    comments: Optional[List[Dict[str, Any]]]
-    fields: Optional[Dict[str, Any]]
+    user: User | None
+    airline: Airline | None
+    aircraft: Aircraft | None
+    flight: Flight | None
+    comments: list[Comment] | None
+    fields: dict[str, Any] | None  # custom PIREP fields; names are defined per airline
 
 # Utility functions for type checking and validation
 
+# Any one of these keys marks a dict as the given resource. Keys are probed in
+# order and the first hit wins, so the one most payloads carry ('id') goes first.
+_USER_MARKERS = ('id', 'name', 'pilot_id')
+_AIRLINE_MARKERS = ('id', 'name', 'icao')
+_USER_BID_MARKERS = ('id', 'flight_id', 'user_id')
+_RANK_MARKERS = ('name',)
+_SUBFLEET_MARKERS = ('id', 'aircraft', 'fares')
+
+_RESOURCE_MARKERS: dict[str, tuple[str, ...]] = {
+    'User': _USER_MARKERS,
+    'Airline': _AIRLINE_MARKERS,
+    'UserBid': _USER_BID_MARKERS,
+    'Rank': _RANK_MARKERS,
+    'Subfleet': _SUBFLEET_MARKERS,
+}
+
+def _has_marker(data: Any, fields: tuple[str, ...]) -> bool:
+    # One dict probe per marker key; frozenset.isdisjoint(dict) would walk every key of data instead
+    if isinstance(data, dict):
+        for key in fields:
+            if key in data:
+                return True
+    return False
+
+def classify(data: Any) -> list[str]:
+    """Names of the resource types data could be, in one pass (empty if not a dict)"""
+    if not isinstance(data, dict):
+        return []
+    return [name for name, fields in _RESOURCE_MARKERS.items() if _has_marker(data, fields)]
+
 def is_user_type(data: Any) -> bool:
     """Check if data matches User type structure"""
-    if not isinstance(data, dict):
-        return False
-    expected_fields = {'id', 'pilot_id', 'name'}
-    return any(field in data for field in expected_fields)
+    return _has_marker(data, _USER_MARKERS)
 
 def is_airline_type(data: Any) -> bool:
     """Check if data matches Airline type structure"""
-    if not isinstance(data, dict):
-        return False
-    expected_fields = {'id', 'icao', 'name'}
-    return any(field in data for field in expected_fields)
+    return _has_marker(data, _AIRLINE_MARKERS)
 
 def is_user_bid_type(data: Any) -> bool:
     """Check if data matches UserBid type structure"""
-    if not isinstance(data, dict):
-        return False
-    expected_fields = {'id', 'user_id', 'flight_id'}
-    return any(field in data for field in expected_fields)
+    return _has_marker(data, _USER_BID_MARKERS)
 
 def is_rank_type(data: Any) -> bool:
     """Check if data matches Rank type structure"""
-    if not isinstance(data, dict):
-        return False
-    return 'name' in data
+    return _has_marker(data, _RANK_MARKERS)
 
 def is_subfleet_type(data: Any) -> bool:
     """Check if data matches Subfleet type structure"""
-    if not isinstance(data, dict):
-        return False
-    return 'fares' in data or 'aircraft' in data or 'id' in data
+    return _has_marker(data, _SUBFLEET_MARKERS)
+
+# Declared keys of each resource in declaration order, for iterating without touching
+# __annotations__. `data.keys() - FLIGHT_FIELDS` lists keys the API sent that the type
+# does not know about (API drift).
+FLIGHT_FIELDS = tuple(Flight.__annotations__)
+FARE_FIELDS = tuple(Fare.__annotations__)
+AIRCRAFT_FIELDS = tuple(Aircraft.__annotations__)
+AIRLINE_FIELDS = tuple(Airline.__annotations__)
+USER_BID_FIELDS = tuple(UserBid.__annotations__)
+SUBFLEET_FIELDS = tuple(Subfleet.__annotations__)
+RANK_FIELDS = tuple(Rank.__annotations__)
+USER_FIELDS = tuple(User.__annotations__)
+COMMENT_FIELDS = tuple(Comment.__annotations__)
+PIREP_FIELDS = tuple(Pirep.__annotations__)
+
+def _scalar_fields(cls: type) -> dict[type, tuple[str, ...]]:
+    """Group a resource's int/str/float/bool fields (optional or not) by type."""
+    groups: dict[type, list[str]] = {int: [], str: [], float: [], bool: []}
+    for name, hint in get_type_hints(cls).items():
+        args = tuple(a for a in get_args(hint) if a is not type(None)) or (hint,)
+        if len(args) == 1 and args[0] in groups:
+            groups[args[0]].append(name)
+    return {t: tuple(names) for t, names in groups.items()}
+
+# Scalar fields of each resource grouped by type, in declaration order, so a serializer
+# can loop over one kind only: SCALAR_FIELDS[Pirep][float] -> ('distance', ...)
+SCALAR_FIELDS: dict[type, dict[type, tuple[str, ...]]] = {
+    cls: _scalar_fields(cls)
+    for cls in (Flight, Fare, Aircraft, Airline, UserBid, Subfleet, Rank, User, Comment, Pirep)
+}
 
 # Export all types for easy importing
 __all__ = [
     'User', 'Airline', 'UserBid', 'Rank', 'Subfleet',
-    'Flight', 'Fare', 'Aircraft', 'Pirep',
+    'Flight', 'Fare', 'Aircraft', 'Pirep', 'Comment',
     'is_user_type', 'is_airline_type', 'is_user_bid_type',
-    'is_rank_type', 'is_subfleet_type'
+    'is_rank_type', 'is_subfleet_type', 'classify',
+    'FLIGHT_FIELDS', 'FARE_FIELDS', 'AIRCRAFT_FIELDS', 'AIRLINE_FIELDS', 'USER_BID_FIELDS',
+    'SUBFLEET_FIELDS', 'RANK_FIELDS', 'USER_FIELDS', 'COMMENT_FIELDS', 'PIREP_FIELDS',
+    'SCALAR_FIELDS'
 ]